@@ -4,7 +4,8 @@ from pathlib import Path
 import logging
 import os
 import shutil
-from typing import Dict, Iterable, List, Optional, Tuple
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from typing import cast
 
@@ -24,6 +25,11 @@ class WorldService:
         self.repository: WorldRepository = repository or JsonWorldRepository()
         self.worlds: Dict[str, World] = {}
         self.current_world: Optional[str] = None
+        # bumped on every mutation so views can skip rebuilding unchanged state
+        self._version = 0
+        # Last view model a UI built from this service, as (key, view model);
+        # the UI owns the key and contents (see AsciiViewModel.from_controller)
+        self.view_model_cache: Optional[Tuple[Any, Any]] = None
         # persistent data root (default: ./data). Worlds and state live here.
         # persistent worlds directory now under server data dir (default: ./data/worlds)
         data_root = Path(os.environ.get("HEXI_DATA_DIR", "data"))
@@ -52,12 +58,14 @@ class WorldService:
         init_snap = world.snapshot(["Initial state created"])  # index 0
         world.history.append(init_snap)
         world.history_index = 1
+        self._touch()
         self._persist_world(world)
 
     def select_world(self, name: str) -> World:
         if name not in self.worlds:
             raise KeyError(f"Unknown world: {name}")
         self.current_world = name
+        self._touch()
         self._save_last_state()
         return self.worlds[name]
 
@@ -69,12 +77,20 @@ class WorldService:
     def current_automaton(self) -> HexAutomaton:
         return self.get_current_world().hex
 
+    def version(self) -> int:
+        """Return a counter that increases whenever worlds, cells or history change."""
+        return self._version
+
+    def _touch(self) -> None:
+        self._version += 1
+
     # Persistence
     def save_world_to_file(
         self, path: str, is_hexidirect: bool, rules_text: str
     ) -> None:
         world = self.get_current_world()
         world.rules_text = rules_text
+        self._touch()
         self.repository.save(world, Path(path))
         # remember last opened world path
         self._save_last_state(Path(path))
@@ -103,6 +119,7 @@ class WorldService:
         self.worlds[new_name] = world
         if self.current_world == old_name:
             self.current_world = new_name
+        self._touch()
         self._save_last_state()
         # rename on disk: delete old file if present, save new
         old_path = self.worlds_dir / f"{old_name}.json"
@@ -122,6 +139,7 @@ class WorldService:
                 logger.warning("could not remove %s: %s", name, exc)
             if self.current_world == name:
                 self.current_world = None
+            self._touch()
             self._save_last_state()
 
     # History APIs
@@ -134,16 +152,19 @@ class WorldService:
             w.history = w.history[:idx]
         w.history.append(snap)
         w.history_index = idx + 1
+        self._touch()
         return snap
 
-    def history_list(self) -> List[Tuple[int, int]]:
-        """Return list of (index, active_count)."""
+    def history_list(self, limit: Optional[int] = None) -> List[Tuple[int, int]]:
+        """Return list of (index, active_count), at most ``limit`` entries."""
         w = self.get_current_world()
-        return [(s.index, s.active_count) for s in w.history]
+        return [(s.index, s.active_count) for s in islice(w.history, limit)]
 
-    def history_get_logs(self, index: int) -> List[str]:
+    def history_get_logs(self, index: int, limit: Optional[int] = None) -> List[str]:
         w = self.get_current_world()
-        return list(w.history[index].logs) if 0 <= index < len(w.history) else []
+        if 0 <= index < len(w.history):
+            return list(islice(w.history[index].logs, limit))
+        return []
 
     def history_get_cells(
         self, index: int
@@ -160,6 +181,7 @@ class WorldService:
         snap = w.history[index]
         w.restore_snapshot(snap)
         w.history_index = index + 1
+        self._touch()
 
     def history_prev(self) -> None:
         w = self.get_current_world()
@@ -227,6 +249,7 @@ class WorldService:
     # Editing and execution
     def clear(self) -> None:
         self.get_current_world().hex.clear()
+        self._touch()
         # persist change
         try:
             self._persist_world(self.get_current_world())
@@ -245,6 +268,7 @@ class WorldService:
                     state = random.choice(pool) if pool else "a"
                     direction = random.choice([None, 1, 2, 3, 4, 5, 6])
                     w.hex.set_cell(q, r, state, direction)
+        self._touch()
         # persist change
         try:
             self._persist_world(w)
@@ -254,6 +278,7 @@ class WorldService:
     def set_cell(self, q: int, r: int, state: str, direction: Optional[int]) -> None:
         w = self.get_current_world()
         w.hex.set_cell(q, r, state, direction)
+        self._touch()
         try:
             self._persist_world(w)
         except Exception as exc:
@@ -261,16 +286,53 @@ class WorldService:
 
     def step(self, rules_text: str) -> List[str]:
         """Apply a single simulation step and return log messages."""
-        logs: List[str] = []
         if not rules_text:
-            return logs
-        logs.append("=" * 50)
-        logs.append("STEP: Starting new simulation step")
+            return []
+        logs = self.step_world(self.get_current_world(), rules_text)
+        # Add to history after step and return the same logs
+        self.history_add(logs)
+        return logs
 
+    def apply_step(
+        self,
+        cells: Iterable[Tuple[int, int, str, Optional[int]]],
+        rules_text: str,
+        logs: List[str],
+    ) -> None:
+        """Install a generation computed by step_world on a copy of the world.
+
+        ``cells`` are the copy's active cells after the step; the current
+        world's grid is swapped in one assignment, its rules are set from
+        ``rules_text`` and the step is recorded in history as step() would.
+        """
         w = self.get_current_world()
+        w.hex.load_cells(cells)
+        rules = self._split_rules(rules_text)
+        if rules:
+            w.rules_text = rules_text
+            w.hex.set_rules(rules)
+        self.history_add(logs)
+
+    @staticmethod
+    def _split_rules(rules_text: str) -> List[str]:
+        """Split rules text into rule strings (one per line or comma)."""
         rules: List[str] = []
         for line in rules_text.split("\n"):
             rules.extend([r.strip() for r in line.split(",") if r.strip()])
+        return rules
+
+    @staticmethod
+    def step_world(w: World, rules_text: str) -> List[str]:
+        """Advance ``w`` one generation in place and return the step logs.
+
+        History and the service version are left alone, so this can run on a
+        detached copy of a world, e.g. on a worker thread.
+        """
+        logs: List[str] = []
+        logs.append("=" * 50)
+        logs.append("STEP: Starting new simulation step")
+
+        rules = WorldService._split_rules(rules_text)
         if rules:
             w.rules_text = "\n".join(rules_text.split("\n"))
             logs.append(f"Rules: {rules}")
@@ -278,29 +340,18 @@ class WorldService:
             logs.append("Expanded rules:")
             for i, rule in enumerate(w.hex.rules, 1):
                 logs.append(f"  {i}: {rule.rule_str}")
+            hex_world = w.hex
+            # One pass over the grid; only the logged sample is formatted
             active_cells = [
-                f"({q},{r}):{cell}"
-                for (q, r), cell in w.hex.grid.items()
-                if cell.state != "_"
+                (pos, cell) for pos, cell in hex_world.grid.items() if cell.state != "_"
             ]
             logs.append(f"Active cells before step: {len(active_cells)}")
-            for cell_info in active_cells[:10]:
-                logs.append(f"  {cell_info}")
+            for (q, r), cell in active_cells[:10]:
+                logs.append(f"  ({q},{r}):{cell}")
             if len(active_cells) > 10:
                 logs.append(f"  ... and {len(active_cells) - 10} more")
-            checked_count = 0
-            match_count = 0
-            hex_world = w.hex
-            prev_active_set = {
-                pos for pos, cell in hex_world.grid.items() if cell.state != "_"
-            }
-            for (q, r), cell in hex_world.grid.items():
-                for rule in hex_world.rules:
-                    checked_count += 1
-                    if rule.source_state == cell.state and hex_world.matches_condition(
-                        cell, q, r, rule
-                    ):
-                        match_count += 1
+            prev_active_set = {pos for pos, _ in active_cells}
+            checked_count, match_count = hex_world.count_condition_matches()
             logs.append(
                 f"Checked {checked_count} rule-cell combinations, found {match_count} matches"
             )
@@ -310,18 +361,14 @@ class WorldService:
             # Before stepping, capture pre-step info if needed
             w.hex.step()
             new_active = [
-                f"({q},{r}):{cell}"
-                for (q, r), cell in w.hex.grid.items()
-                if cell.state != "_"
+                (pos, cell) for pos, cell in hex_world.grid.items() if cell.state != "_"
             ]
             logs.append(f"Active cells after step: {len(new_active)}")
-            for cell_info in new_active[:10]:
-                logs.append(f"  {cell_info}")
+            for (q, r), cell in new_active[:10]:
+                logs.append(f"  ({q},{r}):{cell}")
             if len(new_active) > 10:
                 logs.append(f"  ... and {len(new_active) - 10} more")
-            new_active_set = {
-                pos for pos, cell in w.hex.grid.items() if cell.state != "_"
-            }
+            new_active_set = {pos for pos, _ in new_active}
             births = new_active_set - prev_active_set
             survivals = new_active_set & prev_active_set
             deaths = prev_active_set - new_active_set
@@ -342,8 +389,6 @@ class WorldService:
                     logs.append(f"  ... and {len(deaths) - 10} more")
 
         logs.append("STEP: Completed")
-        # Add to history after step and return the same logs
-        self.history_add(logs)
         return logs
 
     # Utilities
@@ -9,11 +9,13 @@ from __future__ import annotations
 import argparse
 import cmd
 import re
-from typing import Iterable, Sequence
+from typing import Sequence
 
 from domain.hexidirect.rule_engine import HexAutomaton
 from version import __version__
 
+_CELL_RE = re.compile(r"([a-z_]+)(\d+)?")
+
 
 def grid_to_ascii(automaton: HexAutomaton, radius: int = 3) -> str:
     """Return the current grid state as ASCII art (● for non-empty cells)."""
@@ -77,7 +79,7 @@ class HexCLI(cmd.Cmd):
         if state == "0":
             state = "_"
         direction = None
-        match = re.match(r"([a-z_]+)(\d+)?", state)
+        match = _CELL_RE.match(state)
         if match:
             state = match.group(1)
             if match.group(2):
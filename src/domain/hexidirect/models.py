@@ -5,6 +5,8 @@ from typing import Optional
 class HexCell:
     """Represents a cell with state and optional direction."""
 
+    __slots__ = ("state", "direction")
+
     def __init__(self, state: str = "_", direction: Optional[int] = None) -> None:
         self.state = state
         self.direction = direction
@@ -1,12 +1,59 @@
 """Hexagonal rule engine for HexiDirect rules."""
 
+import functools
 import random
 import re
-from typing import Dict, List, Match, Optional, Set, Tuple
+import sys
+from collections import Counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Match,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from .models import HexCell, Condition
 from .rule_parser import HexRule
 
+_REPEAT_RE = re.compile(r"\[([^\]]+)\](\d+)")
+_RANDOM_DIR_RE = re.compile(r"([a-z_]+)%")
+_TARGET_RANDOM_RE = re.compile(r"^([a-z_]+)%$")
+_TARGET_ROT_RE = re.compile(r"^([a-z_]+)%(\d+)$")
+_SOURCE_DIR_RE = re.compile(r"^([a-z_]+)(\d+)$")
+_POINTING_RE = re.compile(r"\[([a-z_]+)\.\]")
+_STATE_DIGITS_RE = re.compile(r"([a-z_]+)\d+")
+_POINTED_COND_RE = re.compile(r"\[(\d+)([a-z_]+)(\d+)\]")
+
+# (direction, opposite direction) pairs for expanding [state.] conditions
+_POINTING_SLOTS: Tuple[Tuple[int, int], ...] = tuple(
+    (d, (d + 2) % 6 + 1) for d in range(1, 7)
+)
+
+# Neighbourhoods memoised per rule set before the memo is reset
+CANDIDATE_MEMO_SIZE = 1 << 16
+
+# Condition matcher: (six neighbour states, six neighbour directions) -> bool
+NeighborMatcher = Callable[[List[str], List[Optional[int]]], bool]
+
+# Shared empty cell for unset and off-grid positions; cells are never mutated
+EMPTY_CELL = HexCell("_")
+
+# Axial neighbour offsets, clockwise from upper-right (direction 1..6)
+NEIGHBOR_OFFSETS: Tuple[Tuple[int, int], ...] = (
+    (1, -1),
+    (1, 0),
+    (0, 1),
+    (-1, 1),
+    (-1, 0),
+    (0, -1),
+)
+
 
 class HexAutomaton:
     """Advanced hexagonal cellular automaton with custom rule notation."""
@@ -15,17 +62,60 @@ class HexAutomaton:
         self.radius = radius
         self.grid: Dict[Tuple[int, int], HexCell] = {}
         self.rules: List[HexRule] = []
+        # self.rules bucketed by source state, rebuilt when its contents change;
+        # the key holds the rule objects, so in-place edits of the list count
+        self._rules_key: Optional[Tuple[HexRule, ...]] = None
+        self._rules_by_state: Dict[
+            str, List[Tuple[HexRule, Optional[NeighborMatcher]]]
+        ] = {}
+        # Shared result cell per (rule, source direction); cells are never
+        # mutated in place, so grids may hold the same HexCell many times
+        self._results: Dict[Tuple[HexRule, Optional[int]], HexCell] = {}
+        # Candidates per neighbourhood key, see _cell_candidates; reset with
+        # the rule buckets
+        self._candidate_memo: Dict[Tuple[Any, ...], List[Tuple[HexRule, HexCell]]]
+        self._candidate_memo = {}
+        self._neighbor_dirs_matter = False
+        # Compiled condition matcher per rule, shared by step and
+        # matches_condition; reset with the rule buckets
+        self._matchers: Dict[HexRule, NeighborMatcher] = {}
+        # Rule strings behind self.rules and the rules they built; set_rules is
+        # a no-op while both are unchanged
+        self._rule_strings: Tuple[str, ...] = ()
+        self._rules_built: Optional[Tuple[HexRule, ...]] = None
+        # False when some rule can fire on an empty, isolated cell
+        self._quiet_stays_empty = True
         self._init_empty_grid()
+        self._build_topology()
 
     def _init_empty_grid(self) -> None:
-        """Initialize grid with empty cells."""
-        for q in range(-self.radius, self.radius + 1):
-            for r in range(-self.radius, self.radius + 1):
-                if abs(q + r) <= self.radius:
-                    self.grid[(q, r)] = HexCell("_")
+        """Initialize grid with the shared empty cell."""
+        radius = self.radius
+        empty = EMPTY_CELL
+        for q in range(-radius, radius + 1):
+            for r in range(max(-radius, -q - radius), min(radius, radius - q) + 1):
+                self.grid[(q, r)] = empty
+
+    def _build_topology(self) -> None:
+        """Index grid cells and their neighbours for list-based stepping.
+
+        ``_neighbors[i]`` holds the six neighbour indices of ``_coords[i]``;
+        off-grid neighbours point at index ``len(_coords)``, a sentinel slot
+        that reads as an empty cell.
+        """
+        self._coords: List[Tuple[int, int]] = list(self.grid)
+        index = {pos: i for i, pos in enumerate(self._coords)}
+        off_grid = len(self._coords)
+        self._neighbors: List[Tuple[int, ...]] = [
+            tuple(index.get((q + dq, r + dr), off_grid) for dq, dr in NEIGHBOR_OFFSETS)
+            for q, r in self._coords
+        ]
 
     def set_rules(self, rule_strings: List[str]) -> None:
         """Set the rules for the automaton."""
+        key = tuple(rule_strings)
+        if key == self._rule_strings and tuple(self.rules) == self._rules_built:
+            return  # the service re-sets the same rule text on every step
         self.rules = []
         processed: List[str] = []
         for rule_str in rule_strings:
@@ -33,17 +123,31 @@ class HexAutomaton:
         for rule_str in processed:
             try:
                 # Expand macros first
-                expanded_rules = self._expand_macros(rule_str)
+                expanded_rules = self._expanded(rule_str)
             except ValueError as e:
                 print(f"Warning: Skipping invalid rule '{rule_str}': {e}")
                 continue
             for expanded_rule in expanded_rules:
                 try:
-                    self.rules.append(HexRule(expanded_rule))
+                    self.rules.append(self._parse(expanded_rule))
                 except ValueError as e:
                     print(
                         f"Warning: Skipping invalid expanded rule '{expanded_rule}': {e}"
                     )
+        self._rule_strings = key
+        self._rules_built = tuple(self.rules)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _expanded(rule_str: str) -> Tuple[str, ...]:
+        """Cached ``_expand_macros``."""
+        return tuple(HexAutomaton._expand_macros(rule_str))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse(rule_str: str) -> HexRule:
+        """Cached ``HexRule`` construction; parsed rules are never mutated."""
+        return HexRule(rule_str)
 
     @staticmethod
     def _expand_presets(rule_str: str) -> List[str]:
@@ -56,7 +160,8 @@ class HexAutomaton:
             ]
         return [rule_str]
 
-    def _expand_macros(self, rule_str: str) -> List[str]:
+    @staticmethod
+    def _expand_macros(rule_str: str) -> List[str]:
         """Expand macro rules like 'x%' and '[y.]' into individual rules."""
         rules = [rule_str]
 
@@ -78,7 +183,7 @@ class HexAutomaton:
                     count = int(m.group(2))
                     return "".join(f"[{block}]" for _ in range(count))
 
-                return re.sub(r"\[([^\]]+)\](\d+)", repl, src)
+                return _REPEAT_RE.sub(repl, src)
 
             source_part = expand_repeats(source_part)
 
@@ -119,18 +224,16 @@ class HexAutomaton:
             expanded_src: List[str] = []
             for base in rules:
                 base_src, base_tgt = [p.strip() for p in base.split("=>", 1)]
-                if re.search(r"([a-z_]+)%", base_src) and not re.search(
-                    r"([a-z_]+)%", base_tgt
-                ):
+                # Split once: even pieces are literal text, odd pieces the
+                # states whose '%' each direction replaces
+                pieces = _RANDOM_DIR_RE.split(base_src)
+                if len(pieces) > 1 and not _RANDOM_DIR_RE.search(base_tgt):
+                    texts = pieces[0::2]
+                    states = pieces[1::2]
                     for direction in range(1, 7):
-
-                        def _repl(m: Match[str], d: int = direction) -> str:
-                            return f"{m.group(1)}{d}"
-
-                        new_source = re.sub(
-                            r"([a-z_]+)%",
-                            _repl,
-                            base_src,
+                        new_source = texts[0] + "".join(
+                            f"{state}{direction}{text}"
+                            for state, text in zip(states, texts[1:])
                         )
                         expanded_src.append(f"{new_source} => {base_tgt}")
                 else:
@@ -142,19 +245,19 @@ class HexAutomaton:
         for rule in rules:
             src_part, tgt_part = [p.strip() for p in rule.split("=>", 1)]
             # Case 1: target ends with % => expand to 6 directions
-            if re.search(r"^([a-z_]+)%$", tgt_part):
+            if _TARGET_RANDOM_RE.search(tgt_part):
                 base = tgt_part[:-1]
                 for direction in range(1, 7):
                     final_rules.append(f"{src_part} => {base}{direction}")
                 continue
 
             # Case 2: target has %N rotation
-            m_rot = re.match(r"^([a-z_]+)%(\d+)$", tgt_part)
+            m_rot = _TARGET_ROT_RE.match(tgt_part)
             if m_rot:
                 target_state = m_rot.group(1)
                 rot = int(m_rot.group(2)) % 6
                 # Detect explicit source direction
-                m_src = re.match(r"^([a-z_]+)(\d+)$", src_part)
+                m_src = _SOURCE_DIR_RE.match(src_part)
                 if m_src:
                     src_dir = int(m_src.group(2))
                     new_dir = ((src_dir + rot - 1) % 6) + 1
@@ -169,18 +272,18 @@ class HexAutomaton:
             final_rules.append(rule)
 
         # Expand pointing conditions [state.] into six directional checks
-        if re.search(r"\[[a-z_]+\.\]", rule_str):
+        if _POINTING_RE.search(rule_str):
             expanded_pointing: List[str] = []
             for rule in final_rules:
-                pointing_match = re.search(r"\[([a-z_]+)\.\]", rule)
+                # Searched per rule: '|' alternatives may point at other states
+                pointing_match = _POINTING_RE.search(rule)
                 if pointing_match:
                     state = pointing_match.group(1)
-                    for direction in range(1, 7):
-                        opposite_dir = ((direction + 3 - 1) % 6) + 1
-                        new_rule = rule.replace(
-                            f"[{state}.]", f"[{direction}{state}{opposite_dir}]"
+                    token = f"[{state}.]"
+                    for direction, opposite_dir in _POINTING_SLOTS:
+                        expanded_pointing.append(
+                            rule.replace(token, f"[{direction}{state}{opposite_dir}]")
                         )
-                        expanded_pointing.append(new_rule)
                 else:
                     expanded_pointing.append(rule)
             final_rules = expanded_pointing
@@ -189,13 +292,40 @@ class HexAutomaton:
 
     def get_cell(self, q: int, r: int) -> HexCell:
         """Get cell at coordinates, return empty cell if out of bounds."""
-        return self.grid.get((q, r), HexCell("_"))
+        return self.grid.get((q, r), EMPTY_CELL)
+
+    def snapshot(
+        self, coords: Optional[Iterable[Tuple[int, int]]] = None
+    ) -> Tuple[List[Tuple[int, int]], List[str], List[Optional[int]]]:
+        """Return parallel lists of coordinates, states and directions.
+
+        Defaults to every grid cell; coordinates outside the grid read as empty.
+        Renderers call this once per frame instead of ``get_cell`` per cell.
+        """
+        positions = list(self.grid) if coords is None else list(coords)
+        get = self.grid.get
+        cells = [get(pos, EMPTY_CELL) for pos in positions]
+        states = [cell.state for cell in cells]
+        directions = [cell.direction for cell in cells]
+        return positions, states, directions
 
     def set_cell(
         self, q: int, r: int, state: str, direction: Optional[int] = None
     ) -> None:
         """Set cell state and direction."""
-        self.grid[(q, r)] = HexCell(state, direction)
+        # Interned so state checks against rule states hit the identity fast path
+        self.grid[(q, r)] = HexCell(sys.intern(state), direction)
+
+    def load_cells(self, cells: Iterable[Tuple[int, int, str, Optional[int]]]) -> None:
+        """Replace the grid with ``cells`` (as from iter_active); others are empty.
+
+        The new grid is built aside and swapped in with one assignment, so a
+        reader on another thread sees either the old or the new generation.
+        """
+        grid = dict.fromkeys(self.grid, EMPTY_CELL)
+        for q, r, state, direction in cells:
+            grid[(q, r)] = HexCell(sys.intern(state), direction)
+        self.grid = grid
 
     def toggle_cell(self, q: int, r: int) -> None:
         """Toggle cell between empty and active state."""
@@ -208,36 +338,47 @@ class HexAutomaton:
     @staticmethod
     def get_neighbors(q: int, r: int) -> List[Tuple[int, int]]:
         """Get neighbor coordinates in clockwise order starting from upper-right."""
-        directions = [(1, -1), (1, 0), (0, 1), (-1, 1), (-1, 0), (0, -1)]
-        return [(q + dq, r + dr) for dq, dr in directions]
+        return [(q + dq, r + dr) for dq, dr in NEIGHBOR_OFFSETS]
 
     def matches_condition(self, cell: HexCell, q: int, r: int, rule: HexRule) -> bool:
         """Check if a cell matches the rule's condition groups."""
         if not rule.conditions:
             return True
+        get = self.grid.get
+        neighbor_cells = [
+            get((q + dq, r + dr), EMPTY_CELL) for dq, dr in NEIGHBOR_OFFSETS
+        ]
+        return self._matcher_for(rule)(
+            [ncell.state for ncell in neighbor_cells],
+            [ncell.direction for ncell in neighbor_cells],
+        )
 
-        neighbors = self.get_neighbors(q, r)
-        neighbor_cells = [self.get_cell(*pos) for pos in neighbors]
-
-        def condition_matches(ncell: HexCell, cond: Condition) -> bool:
-            state_ok = ncell.state == cond.state
+    @staticmethod
+    def _neighbors_match(
+        conditions: List[List[Condition]],
+        states: List[str],
+        directions: List[Optional[int]],
+    ) -> bool:
+        """Match condition groups against six neighbour states and directions."""
+
+        def condition_matches(idx: int, cond: Condition) -> bool:
+            state_ok = states[idx] == cond.state
             if cond.pointing_direction is not None:
-                state_ok = state_ok and ncell.direction == cond.pointing_direction
+                state_ok = state_ok and directions[idx] == cond.pointing_direction
             return not state_ok if cond.negated else state_ok
 
         used: Set[int] = set()
 
         def backtrack(index: int) -> bool:
-            if index == len(rule.conditions):
+            if index == len(conditions):
                 return True
-            group = rule.conditions[index]
+            group = conditions[index]
             for option in group:
                 if option.direction is not None:
                     idx = option.direction - 1
                     if idx in used and not option.negated:
                         continue
-                    ncell = neighbor_cells[idx]
-                    if condition_matches(ncell, option):
+                    if condition_matches(idx, option):
                         if option.negated:
                             if backtrack(index + 1):
                                 return True
@@ -248,14 +389,14 @@ class HexAutomaton:
                             used.remove(idx)
                 else:
                     if option.negated:
-                        if all(condition_matches(nc, option) for nc in neighbor_cells):
+                        if all(condition_matches(idx, option) for idx in range(6)):
                             if backtrack(index + 1):
                                 return True
                     else:
-                        for idx, ncell in enumerate(neighbor_cells):
+                        for idx in range(6):
                             if idx in used:
                                 continue
-                            if condition_matches(ncell, option):
+                            if condition_matches(idx, option):
                                 used.add(idx)
                                 if backtrack(index + 1):
                                     return True
@@ -280,7 +421,11 @@ class HexAutomaton:
         if not self.matches_condition(cell, q, r, rule):
             return None
 
-        # Apply transformation
+        return self._rule_result(cell, rule)
+
+    @staticmethod
+    def _rule_result(cell: HexCell, rule: HexRule) -> HexCell:
+        """Return the cell ``rule`` turns ``cell`` into (source already matched)."""
         new_state = rule.target_state
         new_direction = None
 
@@ -297,60 +442,356 @@ class HexAutomaton:
 
         return HexCell(new_state, new_direction)
 
+    def _source_rules(
+        self,
+    ) -> Dict[str, List[Tuple[HexRule, Optional[NeighborMatcher]]]]:
+        """Return ``self.rules`` with compiled matchers, grouped by source state."""
+        # HexRule has no __eq__, so this compares the rule objects by identity
+        key = tuple(self.rules)
+        if key != self._rules_key:
+            by_state: Dict[str, List[Tuple[HexRule, Optional[NeighborMatcher]]]]
+            by_state = {}
+            self._matchers = {}
+            for rule in self.rules:
+                matcher = None
+                if rule.conditions:
+                    matcher = self._matcher_for(rule)
+                by_state.setdefault(rule.source_state, []).append((rule, matcher))
+            self._rules_by_state = by_state
+            self._rules_key = key
+            self._results = {}
+            self._candidate_memo = {}
+            self._neighbor_dirs_matter = any(
+                option.pointing_direction is not None
+                for rule in self.rules
+                for group in rule.conditions
+                for option in group
+            )
+            self._quiet_stays_empty = not self._fires_when_quiet(by_state.get("_", []))
+        return self._rules_by_state
+
+    def _matcher_for(self, rule: HexRule) -> NeighborMatcher:
+        """Return the compiled condition matcher of ``rule``, compiling it once."""
+        matcher = self._matchers.get(rule)
+        if matcher is None:
+            matcher = self._matchers[rule] = self._compile_conditions(rule.conditions)
+        return matcher
+
+    @staticmethod
+    def _fires_when_quiet(
+        rules: List[Tuple[HexRule, Optional[NeighborMatcher]]],
+    ) -> bool:
+        """Return True if any rule fires on an empty cell with empty neighbours.
+
+        Every such cell sees the same inputs, so when nothing fires here they
+        can all be skipped during a step.
+        """
+        empty_states = ["_"] * 6
+        empty_dirs: List[Optional[int]] = [None] * 6
+        present = {"_"}
+        for rule, matcher in rules:
+            if rule.source_random_direction or rule.source_direction is not None:
+                continue
+            if matcher is None:
+                return True
+            if (
+                rule.neighbor_required <= present
+                and present.isdisjoint(rule.neighbor_forbidden)
+                and not any(present.isdisjoint(g) for g in rule.neighbor_any_of)
+                and matcher(empty_states, empty_dirs)
+            ):
+                return True
+        return False
+
+    @classmethod
+    def _compile_conditions(cls, conditions: List[List[Condition]]) -> NeighborMatcher:
+        """Return a matcher specialised to the shape of ``conditions``.
+
+        Plain ``[s]``/``[-s]`` blocks reduce to neighbour state counts and
+        fixed-slot ``[ds]``/``[-ds]`` blocks to direct slot checks; anything
+        else (alternatives, mixed slots) falls back to ``_neighbors_match``.
+        """
+        singles = [group[0] for group in conditions if len(group) == 1]
+        if len(singles) == len(conditions):
+            if all(
+                c.direction is None and c.pointing_direction is None for c in singles
+            ):
+                need = tuple(Counter(c.state for c in singles if not c.negated).items())
+                banned = tuple({c.state for c in singles if c.negated})
+
+                def match_counts(states: List[str], _dirs: List[Optional[int]]) -> bool:
+                    for state in banned:
+                        if state in states:
+                            return False
+                    for state, count in need:
+                        if states.count(state) < count:
+                            return False
+                    return True
+
+                return match_counts
+            if all(c.direction is not None for c in singles):
+                slots = [c.direction for c in singles if not c.negated]
+                if len(set(slots)) == len(slots):
+                    checks = tuple(
+                        (c.direction - 1, c.state, c.pointing_direction, c.negated)
+                        for c in singles
+                        if c.direction is not None
+                    )
+
+                    def match_slots(
+                        states: List[str], directions: List[Optional[int]]
+                    ) -> bool:
+                        for idx, state, pointing, negated in checks:
+                            ok = states[idx] == state and (
+                                pointing is None or directions[idx] == pointing
+                            )
+                            if ok == negated:
+                                return False
+                        return True
+
+                    return match_slots
+        return functools.partial(cls._neighbors_match, conditions)
+
+    def _step_inputs(
+        self,
+    ) -> Tuple[List[HexCell], List[str], List[Optional[int]]]:
+        """Return cells in index order plus flat states/directions with sentinel."""
+        if len(self._coords) != len(self.grid):
+            self._build_topology()  # set_cell added cells outside the radius
+        cells = [self.grid[pos] for pos in self._coords]
+        states = [cell.state for cell in cells] + ["_"]
+        directions = [cell.direction for cell in cells] + [None]
+        return cells, states, directions
+
+    def _step_indices(
+        self,
+        cells: List[HexCell],
+        by_state: Dict[str, List[Tuple[HexRule, Optional[NeighborMatcher]]]],
+    ) -> Iterable[int]:
+        """Return indices of the cells a step needs to evaluate, in grid order.
+
+        Without rules for empty cells only cells whose state has rules are
+        visited. When quiet cells (empty, with only empty neighbours) cannot
+        change, only non-empty cells and their neighbours are visited.
+        """
+        if "_" not in by_state:
+            return [i for i, cell in enumerate(cells) if cell.state in by_state]
+        if not self._quiet_stays_empty:
+            return range(len(cells))
+        neighbors = self._neighbors
+        frontier: Set[int] = set()
+        for i, cell in enumerate(cells):
+            if cell.state != "_" or cell.direction is not None:
+                frontier.add(i)
+                frontier.update(neighbors[i])
+        frontier.discard(len(cells))
+        return sorted(frontier)
+
+    def _cell_candidates(
+        self,
+        i: int,
+        cell: HexCell,
+        rules: List[Tuple[HexRule, Optional[NeighborMatcher]]],
+        states: List[str],
+        directions: List[Optional[int]],
+    ) -> List[Tuple[HexRule, HexCell]]:
+        """Return (rule, result) for each rule in ``rules`` that fires on cell i.
+
+        Candidates depend only on the cell and its neighbourhood, so they are
+        memoised per neighbourhood for the current rule set; the returned list
+        is shared and must not be mutated.
+        """
+        a, b, c, d, e, f = self._neighbors[i]
+        if self._neighbor_dirs_matter:
+            key: Tuple[Any, ...] = (
+                cell.state,
+                cell.direction,
+                states[a],
+                states[b],
+                states[c],
+                states[d],
+                states[e],
+                states[f],
+                directions[a],
+                directions[b],
+                directions[c],
+                directions[d],
+                directions[e],
+                directions[f],
+            )
+        else:
+            key = (
+                cell.state,
+                cell.direction,
+                states[a],
+                states[b],
+                states[c],
+                states[d],
+                states[e],
+                states[f],
+            )
+        memo = self._candidate_memo
+        candidates = memo.get(key)
+        if candidates is None:
+            if len(memo) >= CANDIDATE_MEMO_SIZE:
+                memo.clear()
+            candidates = memo[key] = self._evaluate_candidates(
+                i, cell, rules, states, directions
+            )
+        return candidates
+
+    def _evaluate_candidates(
+        self,
+        i: int,
+        cell: HexCell,
+        rules: List[Tuple[HexRule, Optional[NeighborMatcher]]],
+        states: List[str],
+        directions: List[Optional[int]],
+    ) -> List[Tuple[HexRule, HexCell]]:
+        """Evaluate every rule in ``rules`` against cell i (see _cell_candidates)."""
+        candidates: List[Tuple[HexRule, HexCell]] = []
+        direction = cell.direction
+        results = self._results
+        nbr_states: Optional[List[str]] = None
+        nbr_dirs: List[Optional[int]] = []
+        present: Set[str] = set()
+        for rule, matcher in rules:
+            if rule.source_random_direction:
+                if direction is None:
+                    continue
+            elif rule.source_direction != direction:
+                continue
+            if matcher is not None:
+                if nbr_states is None:
+                    nbrs = self._neighbors[i]
+                    nbr_states = [states[j] for j in nbrs]
+                    nbr_dirs = [directions[j] for j in nbrs]
+                    present = set(nbr_states)
+                # Cheap set tests reject most cells before backtracking
+                if (
+                    not rule.neighbor_required <= present
+                    or not present.isdisjoint(rule.neighbor_forbidden)
+                    or any(present.isdisjoint(g) for g in rule.neighbor_any_of)
+                ):
+                    continue
+                if not matcher(nbr_states, nbr_dirs):
+                    continue
+            result = results.get((rule, direction))
+            if result is None:
+                result = results[(rule, direction)] = self._rule_result(cell, rule)
+            candidates.append((rule, result))
+        return candidates
+
+    def count_condition_matches(self) -> Tuple[int, int]:
+        """Return (rule-cell pairs checked, pairs whose state and conditions match).
+
+        Gives the same counts as calling ``matches_condition`` for every cell
+        whose state is the rule's source state, but reads neighbours through
+        the flat index instead of building coordinate tuples.
+        """
+        by_state = self._source_rules()
+        cells, states, directions = self._step_inputs()
+        neighbors = self._neighbors
+        matched = 0
+        for i, cell in enumerate(cells):
+            rules = by_state.get(cell.state)
+            if not rules:
+                continue
+            nbrs = neighbors[i]
+            nbr_states = [states[j] for j in nbrs]
+            nbr_dirs = [directions[j] for j in nbrs]
+            for _, matcher in rules:
+                if matcher is None or matcher(nbr_states, nbr_dirs):
+                    matched += 1
+        return len(cells) * len(self.rules), matched
+
     def select_applicable_rules(
         self,
     ) -> Dict[Tuple[int, int], List[Tuple[HexRule, HexCell]]]:
         """Select expanded rules that apply to each cell."""
         selections: Dict[Tuple[int, int], List[Tuple[HexRule, HexCell]]] = {}
-        for (q, r), cell in self.grid.items():
-            for rule in self.rules:
-                result = self.apply_rule(cell, q, r, rule)
-                if result is not None:
-                    selections.setdefault((q, r), []).append((rule, result))
+        by_state = self._source_rules()
+        if not by_state:
+            return selections
+        cells, states, directions = self._step_inputs()
+        for i in self._step_indices(cells, by_state):
+            cell = cells[i]
+            rules = by_state.get(cell.state)
+            if not rules:
+                continue
+            candidates = self._cell_candidates(i, cell, rules, states, directions)
+            if candidates:
+                selections[self._coords[i]] = list(candidates)
         return selections
 
     def apply_random_rules(
         self, selections: Dict[Tuple[int, int], List[Tuple[HexRule, HexCell]]]
     ) -> None:
-        """Apply one randomly chosen rule from selections to each cell."""
-        new_grid: Dict[Tuple[int, int], HexCell] = {}
-        for (q, r), cell in self.grid.items():
-            candidates = selections.get((q, r), [])
-            new_cell = cell
+        """Apply one randomly chosen rule from selections to each cell.
+
+        Selections were computed from the current grid, so only the selected
+        cells are written back, in grid order, into the existing dict.
+        """
+        grid = self.grid
+        for pos in grid:
+            candidates = selections.get(pos)
             if candidates:
-                _, chosen_result = random.choice(candidates)
-                new_cell = chosen_result
-            new_grid[(q, r)] = new_cell
-        self.grid = new_grid
+                grid[pos] = random.choice(candidates)[1]
 
     def step(self) -> None:
-        """Advance the automaton by one generation."""
-        selections = self.select_applicable_rules()
-        self.apply_random_rules(selections)
+        """Advance the automaton by one generation.
+
+        Same result as ``apply_random_rules(select_applicable_rules())`` but
+        picks each cell's rule as soon as its candidates are known, without
+        building the selections dict. Every firing cell draws from the RNG,
+        even with a single candidate, so seeded runs stay reproducible.
+
+        The grid is updated in place: neighbours are read from the snapshot
+        taken by ``_step_inputs``, so only cells that fire are written and no
+        new dict is built per generation.
+        """
+        by_state = self._source_rules()
+        if not by_state:
+            return
+        cells, states, directions = self._step_inputs()
+        choice = random.choice
+        grid = self.grid
+        coords = self._coords
+        for i in self._step_indices(cells, by_state):
+            cell = cells[i]
+            rules = by_state.get(cell.state)
+            if not rules:
+                continue
+            candidates = self._cell_candidates(i, cell, rules, states, directions)
+            if candidates:
+                grid[coords[i]] = choice(candidates)[1]
 
     def _get_base_pattern(self, rule: HexRule) -> str:
         """Get the base pattern of a rule before macro expansion."""
-        import re
-
         # Remove specific directions to get the base pattern
         pattern = rule.rule_str
 
         # Replace specific directions with % to identify base patterns
         # t1[-a] => t2 becomes t%[-a] => t%
-        pattern = re.sub(r"([a-z_]+)\d+", r"\1%", pattern)
+        pattern = _STATE_DIGITS_RE.sub(r"\1%", pattern)
         # _[1t4] => a becomes _[%t%] => a
-        pattern = re.sub(r"\[(\d+)([a-z_]+)(\d+)\]", r"[\2.]", pattern)
+        pattern = _POINTED_COND_RE.sub(r"[\2.]", pattern)
 
         return pattern
 
+    def iter_active(self) -> Iterator[Tuple[int, int, str, Optional[int]]]:
+        """Yield (q, r, state, direction) for every non-empty cell."""
+        for (q, r), cell in self.grid.items():
+            if cell.state != "_":
+                yield q, r, cell.state, cell.direction
+
     def get_active_cells(self) -> Set[Tuple[int, int]]:
         """Get coordinates of all non-empty cells."""
         return {pos for pos, cell in self.grid.items() if cell.state != "_"}
 
     def clear(self) -> None:
         """Clear all cells to empty state."""
-        for pos in self.grid:
-            self.grid[pos] = HexCell("_")
+        self.grid = dict.fromkeys(self.grid, EMPTY_CELL)
 
     def _matches_source_direction(self, cell: HexCell, rule: HexRule) -> bool:
         """Check if the cell matches the rule's source direction requirements.
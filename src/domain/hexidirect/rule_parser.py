@@ -1,12 +1,40 @@
 import re
-from typing import List, Optional
+import sys
+from typing import FrozenSet, List, Optional, Set, Tuple
 
 from .models import Condition
 
+_COND_BLOCK_RE = re.compile(r"\[([^\]]+)\]")
+_STATE_DIR_RE = re.compile(r"([a-z_]+)(\d+)?")
+_ROT_RE = re.compile(r"([a-z_]+)%(\d+)")
+_ABS_DIR_RE = re.compile(r"([a-z_]+)\.(\d+)")
+_COND_TOKEN_RE = re.compile(r"(\d+)?([a-z_]+)(\d+)?")
+
 
 class HexRule:
     """Represents a single hexagonal rule: source => target."""
 
+    # Parsed rules are shared through the engine's parse cache and never
+    # gain attributes after construction
+    __slots__ = (
+        "rule_str",
+        "source_state",
+        "source_direction",
+        "source_random_direction",
+        "target_state",
+        "target_direction",
+        "target_rotation",
+        "condition_direction",
+        "condition_state",
+        "condition_pointing_direction",
+        "condition_negated",
+        "condition_random_dir",
+        "conditions",
+        "neighbor_required",
+        "neighbor_any_of",
+        "neighbor_forbidden",
+    )
+
     def __init__(self, rule_str: str):
         self.rule_str = rule_str
         self.source_state: str = ""
@@ -21,7 +49,15 @@ class HexRule:
         self.condition_negated: bool = False
         self.condition_random_dir: bool = False
         self.conditions: List[List[Condition]] = []
+        # Necessary conditions on the set of neighbour states, see _build_prefilter
+        self.neighbor_required: FrozenSet[str] = frozenset()
+        self.neighbor_any_of: Tuple[FrozenSet[str], ...] = ()
+        self.neighbor_forbidden: FrozenSet[str] = frozenset()
         self.parse_rule(rule_str)
+        # Interned states compare by identity against interned cell states
+        self.source_state = sys.intern(self.source_state)
+        self.target_state = sys.intern(self.target_state)
+        self._build_prefilter()
 
     def parse_rule(self, rule_str: str) -> None:
         try:
@@ -33,10 +69,35 @@ class HexRule:
         except Exception as e:  # noqa: BLE001
             raise ValueError(f"Invalid rule syntax: {rule_str}") from e
 
+    def _build_prefilter(self) -> None:
+        """Derive cheap set tests that any matching neighbourhood must pass.
+
+        A group of positive options needs one of its states among the
+        neighbours; a lone negated, directionless ``[-s]`` forbids ``s``
+        everywhere. Rules failing these tests can skip the full match.
+        """
+        required: Set[str] = set()
+        any_of: List[FrozenSet[str]] = []
+        forbidden: Set[str] = set()
+        for group in self.conditions:
+            if all(not opt.negated for opt in group):
+                states = frozenset(opt.state for opt in group)
+                if len(states) == 1:
+                    required |= states
+                elif states not in any_of:
+                    any_of.append(states)
+            elif len(group) == 1:
+                opt = group[0]
+                if opt.direction is None and opt.pointing_direction is None:
+                    forbidden.add(opt.state)
+        self.neighbor_required = frozenset(required)
+        self.neighbor_any_of = tuple(any_of)
+        self.neighbor_forbidden = frozenset(forbidden)
+
     def _parse_source(self, source: str) -> None:
-        condition_parts = re.findall(r"\[([^\]]+)\]", source)
+        condition_parts = _COND_BLOCK_RE.findall(source)
         if condition_parts:
-            source = re.sub(r"\[[^\]]+\]", "", source)
+            source = _COND_BLOCK_RE.sub("", source)
             for part in condition_parts:
                 options = [self._parse_condition(opt) for opt in part.split("|")]
                 self.conditions.append(options)
@@ -51,7 +112,7 @@ class HexRule:
             self.source_state = source[:-1]
             self.source_random_direction = True
         else:
-            match = re.match(r"([a-z_]+)(\d+)?", source)
+            match = _STATE_DIR_RE.match(source)
             if match:
                 self.source_state = match.group(1)
                 if match.group(2):
@@ -63,17 +124,17 @@ class HexRule:
                 self.target_state = target[:-1]
                 self.target_rotation = 0
             else:
-                match = re.match(r"([a-z_]+)%(\d+)", target)
+                match = _ROT_RE.match(target)
                 if match:
                     self.target_state = match.group(1)
                     self.target_rotation = int(match.group(2))
         elif "." in target:
-            match = re.match(r"([a-z_]+)\.(\d+)", target)
+            match = _ABS_DIR_RE.match(target)
             if match:
                 self.target_state = match.group(1)
                 self.target_direction = int(match.group(2))
         else:
-            match = re.match(r"([a-z_]+)(\d+)?", target)
+            match = _STATE_DIR_RE.match(target)
             if match:
                 self.target_state = match.group(1)
                 if match.group(2):
@@ -88,7 +149,7 @@ class HexRule:
         if condition.endswith("%"):
             random_dir = True
             condition = condition[:-1]
-        match = re.match(r"(\d+)?([a-z_]+)(\d+)?", condition)
+        match = _COND_TOKEN_RE.match(condition)
         direction: Optional[int] = None
         state = ""
         pointing_direction: Optional[int] = None
@@ -99,7 +160,7 @@ class HexRule:
             if match.group(3):
                 pointing_direction = int(match.group(3))
         return Condition(
-            state=state,
+            state=sys.intern(state),
             direction=direction,
             pointing_direction=pointing_direction,
             negated=negated,
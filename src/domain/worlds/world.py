@@ -14,6 +14,10 @@ class World:
     # History management
     history: List[StepSnapshot] = field(default_factory=list)
     history_index: int = 0
+    # (rules_text, its non-blank stripped lines), refreshed by rules_lines()
+    _rules_lines: Tuple[str, Tuple[str, ...]] = field(
+        default=("", ()), init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         self.hex = HexAutomaton(radius=self.radius)
@@ -25,6 +29,15 @@ class World:
             ]
             self.hex.set_rules(rules)
 
+    def rules_lines(self) -> Tuple[str, ...]:
+        """Return the non-blank rule lines, re-split only when rules_text changes."""
+        text = self.rules_text or ""
+        cached_text, lines = self._rules_lines
+        if text != cached_text:
+            lines = tuple(r.strip() for r in text.splitlines() if r.strip())
+            self._rules_lines = (text, lines)
+        return lines
+
     def rename(self, new_name: str) -> None:
         self.name = new_name
 
@@ -33,10 +46,7 @@ class World:
 
         If index is None, uses current history length.
         """
-        active_cells: List[Tuple[int, int, str, Optional[int]]] = []
-        for (q, r), cell in self.hex.grid.items():
-            if cell.state != "_":
-                active_cells.append((q, r, cell.state, cell.direction))
+        active_cells = list(self.hex.iter_active())
         snap = StepSnapshot(
             index=index if index is not None else len(self.history),
             active_count=len(active_cells),
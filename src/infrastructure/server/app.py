@@ -148,12 +148,7 @@ def cells_set(session_id: str, req: CellSetRequest) -> dict:
 @app.get("/cells/current")
 def cells_current(session_id: str) -> List[Tuple[int, int, str, Optional[int]]]:
     svc = sessions.get(session_id)
-    w = svc.get_current_world()
-    out: List[Tuple[int, int, str, Optional[int]]] = []
-    for (q, r), cell in w.hex.grid.items():
-        if cell.state != "_":
-            out.append((q, r, cell.state, cell.direction))
-    return out
+    return list(svc.get_current_world().hex.iter_active())
 
 
 @app.get("/history", response_model=List[HistoryItem])
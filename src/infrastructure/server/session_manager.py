@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import time
 import uuid
-from typing import Dict, Tuple
+from collections import OrderedDict
+from typing import Tuple
 
 from application.world_service import WorldService
 
@@ -11,7 +12,8 @@ class SessionManager:
     """Simple in-memory session -> WorldService map with expiry."""
 
     def __init__(self, ttl_seconds: int = 3600) -> None:
-        self._sessions: Dict[str, Tuple[WorldService, float]] = {}
+        # Least recently used first, so expired sessions sit at the front
+        self._sessions: "OrderedDict[str, Tuple[WorldService, float]]" = OrderedDict()
         self._ttl = float(ttl_seconds)
 
     def create(self) -> str:
@@ -22,10 +24,10 @@ class SessionManager:
 
     def get(self, sid: str) -> WorldService:
         self.prune()
-        if sid not in self._sessions:
-            self._sessions[sid] = (WorldService(), time.time())
-        svc, _ = self._sessions[sid]
+        entry = self._sessions.get(sid)
+        svc = WorldService() if entry is None else entry[0]
         self._sessions[sid] = (svc, time.time())
+        self._sessions.move_to_end(sid)
         return svc
 
     def destroy(self, sid: str) -> None:
@@ -33,6 +35,9 @@ class SessionManager:
 
     def prune(self) -> None:
         cutoff = time.time() - self._ttl
-        stale = [sid for sid, (_, ts) in self._sessions.items() if ts < cutoff]
-        for sid in stale:
-            self._sessions.pop(sid, None)
+        sessions = self._sessions
+        while sessions:
+            _, ts = next(iter(sessions.values()))
+            if ts >= cutoff:
+                break
+            sessions.popitem(last=False)
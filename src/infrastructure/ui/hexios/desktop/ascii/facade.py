@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Callable, List, Optional, Tuple, cast
+from typing import Callable, Dict, List, Optional, Tuple, cast
 from application.world_service import WorldService
 from infrastructure.ui.hexios.desktop.ascii.viewmodel import AsciiViewModel
 from infrastructure.ui.hexios.desktop.ascii.renderer import (
@@ -24,9 +24,18 @@ class AsciiUILayout:
         self.selected_info = selected_info
 
     def render(self) -> Tuple[List[str], List[List[Tuple[int, int, str]]]]:
-        vm = AsciiViewModel.from_controller(
+        return self.render_view_model(self.view_model())
+
+    def view_model(self) -> AsciiViewModel:
+        """Snapshot what the panel shows as plain data (reads the controller)."""
+        return AsciiViewModel.from_controller(
             self.controller, selected_info=self.selected_info
         )
+
+    def render_view_model(
+        self, vm: AsciiViewModel
+    ) -> Tuple[List[str], List[List[Tuple[int, int, str]]]]:
+        """Lay out a view model; never touches the controller."""
         layout = GridLayoutSpec.default_layout()
         renderer: AsciiRenderer = AsciiRenderer(vm, layout, self.selection)
         result = renderer.render()
@@ -48,15 +57,21 @@ class AsciiControlPanel:
         self.width = 81
 
     def render(self) -> str:
-        layout = AsciiUILayout(self.controller)
-        lines, _ = layout.render()
-        return "\n".join(lines)
+        # Text only: the REPL never uses the tag ranges
+        vm = AsciiViewModel.from_controller(self.controller)
+        renderer = AsciiRenderer(
+            vm, GridLayoutSpec.default_layout(), SelectionState(mode="top")
+        )
+        return "\n".join(renderer.render_text_only())
 
     def run(self) -> None:
         import sys
 
         input_stream = self.input_stream or sys.stdin
-        output_stream = self.output_stream or sys.stdout
+        handlers: Dict[str, Callable[[], None]] = {
+            "s": self._do_step,
+            "c": self._do_clear,
+        }
 
         while True:
             try:
@@ -68,21 +83,28 @@ class AsciiControlPanel:
                     continue
                 if command == "q":
                     break
+                handler = handlers.get(command)
+                if handler is not None:
+                    handler()
                 elif command.startswith("r "):
-                    rule_text = command[2:].strip()
-                    world = self.controller.get_current_world()
-                    world.rules_text = rule_text
-                    if self.output_stream:
-                        self.output_stream.write("Rule set\n")
-                elif command == "s":
-                    world = self.controller.get_current_world()
-                    self.controller.step(world.rules_text or "")
-                    if self.output_stream:
-                        self.output_stream.write("Stepped\n")
-                elif command == "c":
-                    world = self.controller.get_current_world()
-                    world.hex.clear()
-                    if self.output_stream:
-                        self.output_stream.write("Cleared\n")
+                    self._do_set_rules(command[2:].strip())
             except (EOFError, KeyboardInterrupt):
                 break
+
+    def _report(self, message: str) -> None:
+        if self.output_stream:
+            self.output_stream.write(message + "\n")
+
+    def _do_set_rules(self, rule_text: str) -> None:
+        world = self.controller.get_current_world()
+        world.rules_text = rule_text
+        self._report("Rule set")
+
+    def _do_step(self) -> None:
+        world = self.controller.get_current_world()
+        self.controller.step(world.rules_text or "")
+        self._report("Stepped")
+
+    def _do_clear(self) -> None:
+        self.controller.clear()
+        self._report("Cleared")
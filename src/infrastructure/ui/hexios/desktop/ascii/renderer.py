@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
@@ -56,6 +57,143 @@ except Exception:  # pragma: no cover
     AsciiViewModel = object  # type: ignore
 
 
+# Border connectivity bits per cell: N=1, E=2, S=4, W=8
+N, E, S, Wb = 1, 2, 4, 8
+
+# Box-drawing character for each of the 16 bitmasks, indexed by the mask
+_BITS_LUT: Tuple[str, ...] = (
+    " ",  # 0
+    "\u2502",  # N
+    "\u2500",  # E
+    "\u2514",  # N | E
+    "\u2502",  # S
+    "\u2502",  # N | S
+    "\u250c",  # S | E
+    "\u251c",  # N | S | E
+    "\u2500",  # W
+    "\u2518",  # N | W
+    "\u2500",  # E | W
+    "\u2524",  # N | E | W
+    "\u2510",  # S | W
+    "\u252c",  # N | S | W
+    "\u2534",  # S | E | W
+    "\u253c",  # N | S | E | W
+)
+
+# Frame rectangle plus whether it is the selected frame: (x, y, w, h, selected)
+BoxSpec = Tuple[int, int, int, int, bool]
+
+
+@functools.lru_cache(maxsize=32)
+def _border_template(
+    W: int, H: int, boxes: Tuple[BoxSpec, ...]
+) -> Tuple[Tuple[str, ...], Tuple[Tuple[Tuple[int, int, str], ...], ...]]:
+    """Rasterize frame borders once per layout and selection.
+
+    Returns the flat row-major surface holding only box-drawing characters
+    and, per row, the border tag ranges in frame order. The layout geometry
+    never changes between renders, so every frame reuses the same template.
+    """
+    # We'll draw borders into a connectivity grid (bitmask per cell) then
+    # translate that into box-drawing characters so adjacent frames share
+    # proper connectors.
+    bits = [0] * (W * H)
+
+    # Keep simple record of border ranges for tagging per line
+    tags: List[List[Tuple[int, int, str]]] = [[] for _ in range(H)]
+
+    def mark_box(x: int, y: int, w: int, h: int, sel: bool = False) -> None:
+        # top row
+        row = y * W
+        for xi in range(x, x + w):
+            if xi == x:
+                bits[row + xi] |= E | S
+            elif xi == x + w - 1:
+                bits[row + xi] |= Wb | S
+            else:
+                bits[row + xi] |= E | Wb
+        # middle verticals
+        for yy in range(y + 1, y + h - 1):
+            bits[yy * W + x] |= N | S
+            # modulo: a zero-width box wraps to the row end, like index -1
+            bits[yy * W + (x + w - 1) % W] |= N | S
+        # bottom row
+        if h > 1:
+            row = (y + h - 1) * W
+            for xi in range(x, x + w):
+                if xi == x:
+                    bits[row + xi] |= E | N
+                elif xi == x + w - 1:
+                    bits[row + xi] |= Wb | N
+                else:
+                    bits[row + xi] |= E | Wb
+
+        # record ranges for tags
+        tag = "border_sel" if sel else "border"
+        branges = [(y, x, x + w), (y + h - 1, x, x + w)]
+        for yy in range(y + 1, y + h - 1):
+            branges.append((yy, x, x + 1))
+            branges.append((yy, x + w - 1, x + w))
+        for yy, sx, ex in branges:
+            if 0 <= yy < H:
+                tags[yy].append((sx, min(ex, W), tag))
+
+    for x, y, w, h, sel in boxes:
+        mark_box(x, y, w, h, sel)
+
+    # Build surface from bits: one flat row-major tuple, row y at [y * W:]
+    surface = tuple(_BITS_LUT[b] for b in bits)
+    return surface, tuple(tuple(row) for row in tags)
+
+
+# Surface writes as (flat index, text) and content tags as (row, tag range)
+OverlaySpec = Tuple[
+    Tuple[Tuple[int, str], ...], Tuple[Tuple[int, Tuple[int, int, str]], ...]
+]
+
+
+def _clipped_run(W: int, y: int, x: int, text: str) -> Optional[Tuple[int, str]]:
+    """Return the part of ``text`` at (x, y) inside row y as (flat index, text)."""
+    lo, hi = max(x, 0), min(x + len(text), W)
+    if lo >= hi:
+        return None
+    return y * W + lo, text[lo - x : hi - x]
+
+
+@functools.lru_cache(maxsize=64)
+def _frame_overlay(
+    W: int,
+    H: int,
+    rect: Tuple[int, int, int, int],
+    title: str,
+    hotkey: str,
+    lines: Tuple[str, ...],
+) -> OverlaySpec:
+    """Lay out one frame's title, hotkey hint and body lines, clipped to the surface.
+
+    Cached on the frame's content, so frames that did not change since an
+    earlier render cost only the replay of their writes.
+    """
+    x, y, w, h = rect
+    runs: List[Optional[Tuple[int, str]]] = []
+    tags: List[Tuple[int, Tuple[int, int, str]]] = []
+    if 0 <= y < H:
+        # Title centered
+        text = f" {title} "
+        runs.append(_clipped_run(W, y, x + max(1, (w - len(text)) // 2), text))
+        # Hotkey hint in corner
+        if hotkey:
+            runs.append(_clipped_run(W, y, x + 2, f"[{hotkey.upper()}]"))
+    # Body lines
+    for i, line in enumerate(lines):
+        yy = y + 1 + i
+        if 0 <= yy < H:
+            runs.append(_clipped_run(W, yy, x + 1, line[: w - 2]))
+            # tag whole content area line
+            tags.append((yy, (x + 1, min(W, x + w - 1), "normal")))
+    return tuple(run for run in runs if run is not None), tuple(tags)
+
+
 class AsciiRenderer:
     def __init__(
         self,
@@ -68,17 +206,33 @@ class AsciiRenderer:
         self.selection = selection
 
     def render(self) -> Tuple[List[str], List[List[Tuple[int, int, str]]]]:
-        W, H = self.layout.width, self.layout.height
-        # We'll draw borders into a connectivity grid (bitmask per cell) then
-        # translate that into box-drawing characters so adjacent frames share
-        # proper connectors.
-        bits_grid = [[0 for _ in range(W)] for _ in range(H)]
-        # Bits: N=1, E=2, S=4, W=8
-        N, E, S, Wb = 1, 2, 4, 8
-
-        # Keep simple record of border ranges for tagging per line
+        H = self.layout.height
         tags: List[List[Tuple[int, int, str]]] = [[] for _ in range(H)]
+        surface, border_tags = self._draw_surface(tags)
+
+        # Border tags follow the content tags on each row
+        for yy, row_tags in enumerate(border_tags):
+            tags[yy].extend(row_tags)
 
+        return self._lines(surface), tags
+
+    def render_text_only(self) -> List[str]:
+        """Render the lines alone, skipping all tag bookkeeping."""
+        surface, _ = self._draw_surface(None)
+        return self._lines(surface)
+
+    def _lines(self, surface: List[str]) -> List[str]:
+        W, H = self.layout.width, self.layout.height
+        return ["".join(surface[y * W : (y + 1) * W]) for y in range(H)]
+
+    def _draw_surface(
+        self, tags: Optional[List[List[Tuple[int, int, str]]]]
+    ) -> Tuple[List[str], Tuple[Tuple[Tuple[int, int, str], ...], ...]]:
+        """Draw borders and frame content; record content tags if ``tags`` is given.
+
+        Returns the flat surface and the cached per-row border tags.
+        """
+        W, H = self.layout.width, self.layout.height
         frames_by_id = {f.id: f for f in self.vm.frames}
         layout_map = {
             "header": self.layout.header,
@@ -90,128 +244,30 @@ class AsciiRenderer:
             "footer": self.layout.footer,
         }
 
-        frame_border_ranges = {}
-
-        def mark_box(x: int, y: int, w: int, h: int, fid: str, sel: bool = False) -> None:
-            # top row
-            for xi in range(x, x + w):
-                if xi == x:
-                    bits_grid[y][xi] |= (E | S)
-                elif xi == x + w - 1:
-                    bits_grid[y][xi] |= (Wb | S)
-                else:
-                    bits_grid[y][xi] |= (E | Wb)
-            # middle verticals
-            for yy in range(y + 1, y + h - 1):
-                bits_grid[yy][x] |= (N | S)
-                bits_grid[yy][x + w - 1] |= (N | S)
-            # bottom row
-            if h > 1:
-                by = y + h - 1
-                for xi in range(x, x + w):
-                    if xi == x:
-                        bits_grid[by][xi] |= (E | N)
-                    elif xi == x + w - 1:
-                        bits_grid[by][xi] |= (Wb | N)
-                    else:
-                        bits_grid[by][xi] |= (E | Wb)
-
-            # record ranges for tags
-            branges = []
-            branges.append((y, x, x + w, "border_sel" if sel else "border"))
-            branges.append((y + h - 1, x, x + w, "border_sel" if sel else "border"))
-            for yy in range(y + 1, y + h - 1):
-                branges.append((yy, x, x + 1, "border_sel" if sel else "border"))
-                branges.append((yy, x + w - 1, x + w, "border_sel" if sel else "border"))
-            frame_border_ranges[fid] = branges
-
-        # Mark bits for all frames first
-        for fid, rect in layout_map.items():
-            if fid not in frames_by_id:
-                continue
-            frame = frames_by_id[fid]
-            x, y, w, h = rect
-            sel = self.selection.mode == "frame" and self.selection.frame_id == fid
-            mark_box(x, y, w, h, fid, sel)
-
-        # Map bitmask to box-drawing char
-        bits_to_char = {
-            0: " ",
-            N: "\u2502",
-            S: "\u2502",
-            E: "\u2500",
-            Wb: "\u2500",
-            N | S: "\u2502",
-            E | Wb: "\u2500",
-            N | E: "\u2514",  # up+right -> corner? will be adjusted
-            N | Wb: "\u2518",
-            S | E: "\u250c",
-            S | Wb: "\u2510",
-            N | E | Wb: "\u2524",
-            S | E | Wb: "\u2534",
-            N | S | E: "\u251c",
-            N | S | Wb: "\u252c",
-            N | S | E | Wb: "\u253c",
-        }
-
-        # Fallback helper: compute char from bits
-        def char_for_bits(b: int) -> str:
-            # Normalize symmetrical cases
-            if b in bits_to_char:
-                return bits_to_char[b]
-            # try common combos
-            if b & (E | Wb) and b & (N | S):
-                return "\u253c"
-            if b & (E | Wb):
-                return "\u2500"
-            if b & (N | S):
-                return "\u2502"
-            return " "
-
-        # Build surface from bits
-        surface = [[" " for _ in range(W)] for _ in range(H)]
-        for y in range(H):
-            for x in range(W):
-                ch = char_for_bits(bits_grid[y][x])
-                surface[y][x] = ch
+        # Borders for the frames present come from the cached template
+        boxes = tuple(
+            (
+                *rect,
+                self.selection.mode == "frame" and self.selection.frame_id == fid,
+            )
+            for fid, rect in layout_map.items()
+            if fid in frames_by_id
+        )
+        template, border_tags = _border_template(W, H, boxes)
+        surface = list(template)
 
         # Now overlay frame content (body lines) and titles/hotkeys, and record tags
         for fid, rect in layout_map.items():
             if fid not in frames_by_id:
                 continue
             frame = frames_by_id[fid]
-            x, y, w, h = rect
-            # Title centered
-            title = f" {frame.title} "
-            start = x + max(1, (w - len(title)) // 2)
-            for i, ch in enumerate(title):
-                xi = start + i
-                if 0 <= xi < self.layout.width and 0 <= y < self.layout.height:
-                    surface[y][xi] = ch
-            # Hotkey hint in corner
-            if frame.hotkey:
-                hk = f"[{frame.hotkey.upper()}]"
-                for i, ch in enumerate(hk):
-                    xi = x + 2 + i
-                    if 0 <= xi < self.layout.width and 0 <= y < self.layout.height:
-                        surface[y][xi] = ch
-            # Body lines
-            max_lines = max(0, h - 2)
-            for i, line in enumerate(frame.lines[:max_lines]):
-                yy = y + 1 + i
-                if 0 <= yy < self.layout.height:
-                    for j, ch in enumerate(line[: w - 2]):
-                        xi = x + 1 + j
-                        if 0 <= xi < self.layout.width:
-                            surface[yy][xi] = ch
-                    # tag whole content area line
-                    tags[yy].append((x + 1, min(self.layout.width, x + w - 1), "normal"))
-
-        # Collect border tags from recorded ranges
-        for fid, branges in frame_border_ranges.items():
-            for (yy, sx, ex, tag) in branges:
-                if 0 <= yy < H:
-                    tags[yy].append((sx, min(ex, W), tag))
-
-        lines = ["".join(row) for row in surface]
-        return lines, tags
+            max_lines = max(0, rect[3] - 2)
+            writes, frame_tags = _frame_overlay(
+                W, H, rect, frame.title, frame.hotkey, tuple(frame.lines[:max_lines])
+            )
+            for i, text in writes:
+                surface[i : i + len(text)] = text
+            if tags is not None:
+                for yy, tag in frame_tags:
+                    tags[yy].append(tag)
+        return surface, border_tags
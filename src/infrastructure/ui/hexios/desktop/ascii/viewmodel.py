@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from itertools import islice
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from application.world_service import WorldService
 
+_SEPARATOR = "\u2500" * 36
+
 
 @dataclass
 class FrameVM:
@@ -33,10 +36,10 @@ class WorldsVM:
         lines: List[str] = [
             f"Current: {self.world_name}",
             f"Radius: {self.radius} | Active: {self.active}",
-            "\u2500" * 36,
+            _SEPARATOR,
             "World List:",
         ]
-        for i, name in enumerate(self.world_names[:10], start=1):
+        for i, name in enumerate(self.world_names, start=1):
             mark = "*" if name == self.world_name else " "
             lines.append(f"{i}. {name} {mark}")
         return FrameVM(id="worlds", title="Worlds", hotkey="w", lines=lines)
@@ -44,15 +47,11 @@ class WorldsVM:
 
 @dataclass
 class RulesVM:
-    rules_text: str
+    rules_lines: Tuple[str, ...]
 
     def to_frame(self) -> FrameVM:
-        lines: List[str] = ["Current Rules:", "\u2500" * 36]
-        if self.rules_text:
-            for rule in self.rules_text.splitlines():
-                rule = rule.strip()
-                if rule:
-                    lines.append(rule)
+        lines: List[str] = ["Current Rules:", _SEPARATOR]
+        lines.extend(self.rules_lines)
         return FrameVM(id="rules", title="Rules", hotkey="r", lines=lines)
 
 
@@ -65,9 +64,9 @@ class HistoryVM:
     def to_frame(self) -> FrameVM:
         lines: List[str] = [
             f"Generation: {self.generation} | Active: {self.active}",
-            "\u2500" * 36,
+            _SEPARATOR,
         ]
-        for idx, count in self.history_counts[:12]:
+        for idx, count in self.history_counts:
             lines.append(f"Gen {idx}: {count} cells")
         return FrameVM(id="history", title="History", hotkey="h", lines=lines)
 
@@ -77,8 +76,8 @@ class LogsVM:
     logs: List[str]
 
     def to_frame(self) -> FrameVM:
-        lines: List[str] = ["Recent Actions:", "\u2500" * 36]
-        for lg in self.logs[:12]:
+        lines: List[str] = ["Recent Actions:", _SEPARATOR]
+        for lg in self.logs:
             lines.append(lg)
         return FrameVM(id="logs", title="Step Logs", hotkey="l", lines=lines)
 
@@ -104,6 +103,37 @@ class AsciiViewModel:
     @staticmethod
     def from_controller(
         controller: WorldService, selected_info: Optional[str] = None
+    ) -> "AsciiViewModel":
+        """Build the view model, reusing the last one while its inputs are unchanged.
+
+        The key is the controller's version plus what can change without
+        bumping it (the selected world's rules text) and the selection line.
+        Returned view models are shared and must not be mutated.
+        """
+        try:
+            rules_text: Optional[str] = controller.get_current_world().rules_text
+        except RuntimeError:
+            rules_text = None
+        key = (
+            controller.version(),
+            controller.current_world,
+            rules_text,
+            selected_info,
+        )
+        cached = controller.view_model_cache
+        if (
+            cached is not None
+            and cached[0] == key
+            and isinstance(cached[1], AsciiViewModel)
+        ):
+            return cached[1]
+        vm = AsciiViewModel._build(controller, selected_info)
+        controller.view_model_cache = (key, vm)
+        return vm
+
+    @staticmethod
+    def _build(
+        controller: WorldService, selected_info: Optional[str] = None
     ) -> "AsciiViewModel":
         try:
             world = controller.get_current_world()
@@ -137,17 +167,19 @@ class AsciiViewModel:
             world_name=world.name,
             radius=world.radius,
             active=active,
-            world_names=list(controller.worlds.keys()),
+            world_names=list(islice(controller.worlds, 10)),
         ).to_frame()
-        rules_f = RulesVM(rules_text=world.rules_text or "").to_frame()
-        hist_list = controller.history_list()
+        rules_f = RulesVM(rules_lines=world.rules_lines()).to_frame()
+        hist_list = controller.history_list(limit=12)
         history_f = HistoryVM(
             generation=controller.history_current_index(),
             active=active,
             history_counts=hist_list,
         ).to_frame()
         logs_f = LogsVM(
-            logs=controller.history_get_logs(controller.history_current_index()) or []
+            logs=controller.history_get_logs(
+                controller.history_current_index(), limit=12
+            )
         ).to_frame()
         frames: List[FrameVM] = [header_f, worlds_f, rules_f, history_f, logs_f]
         if selected_info:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import tkinter as tk
-from typing import Optional
+from typing import Dict, Optional
 
 from application.world_service import WorldService
 from domain.constants import STATE_COLORS
@@ -22,13 +22,13 @@ def run_hexiscope(
     helper.canvas.config(bg="#3d033d", highlightthickness=0)
     helper.canvas.pack(anchor="center", expand=True, fill=tk.BOTH)
 
-    # Initial draw
+    # Initial draw; outlines come precomputed and colours are resolved once per state
     canvas = helper.canvas
     canvas.delete("all")
-    for (q, r_ax), (cx, cy) in helper.cells.items():
-        cell = world.hex.get_cell(q, r_ax)
-        color = (
-            "#111111" if cell.state == "_" else STATE_COLORS.get(cell.state, "#ffffff")
-        )
-        pts = helper.polygon_corners(cx, cy)
+    colors: Dict[str, str] = {"_": "#111111"}
+    for (q, r_ax), pts in helper.cell_polygons.items():
+        state = world.hex.get_cell(q, r_ax).state
+        color = colors.get(state)
+        if color is None:
+            color = colors[state] = STATE_COLORS.get(state, "#ffffff")
         canvas.create_polygon(pts, fill=color, outline="#333333")
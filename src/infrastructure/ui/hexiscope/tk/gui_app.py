@@ -4,19 +4,55 @@
 Infrastructure location for the Tk GUI, replacing src/ui/hexiscope/tk/gui_app.py.
 """
 
+import queue
 import tkinter as tk
+import tkinter.font as tkfont
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import ttk
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, cast
 
 from application.world_service import WorldService
 from infrastructure.ui.hexios.desktop.ascii.facade import AsciiUILayout, SelectionState
+from infrastructure.ui.hexios.desktop.ascii.viewmodel import AsciiViewModel
 from main import HexCanvas
 from domain.constants import STATE_COLORS
+from domain.worlds.world import World
 
 # Configuration
 DEFAULT_RADIUS = 8
 WINDOW_WIDTH = 1400
 WINDOW_HEIGHT = 900
+# Hotkeys (either case) that select an ASCII panel frame
+FRAME_KEYS = {"w": "worlds", "r": "rules", "h": "history", "l": "logs"}
+MOTION_INTERVAL_MS = 16  # hover is resolved at most once per ~60 Hz frame
+ASCII_POLL_MS = 30  # how often Tk collects finished ASCII layouts
+STEP_POLL_MS = 15  # how often Tk checks for a finished background step
+EMPTY_CELL_COLOR = "#111111"
+UNKNOWN_CELL_COLOR = "#ffffff"
+# Canvas fill per state; the empty state gets the dark background colour
+CELL_FILLS: Dict[str, str] = {**STATE_COLORS, "_": EMPTY_CELL_COLOR}
+
+# ASCII panel styling: (tag, foreground, background), lowest priority first.
+# Later entries win where ranges overlap, as with Tk Text tag priorities.
+ASCII_BG = "#3d033d"
+ASCII_FG = "#ffffff"
+# Blank layout shown when rendering fails; shared and never mutated
+BLANK_ASCII_LINES: Tuple[str, ...] = (" " * 81,) * 51
+BLANK_ASCII_TAGS: Tuple[Tuple[Tuple[int, int, str], ...], ...] = ((),) * 51
+ASCII_TAG_STYLES: Tuple[Tuple[str, Optional[str], Optional[str]], ...] = (
+    ("border", "#cccccc", None),
+    ("title", "#ffffff", None),
+    ("status", "#d0d0d0", None),
+    ("section_header", "#a0a0ff", None),
+    ("selected_item", "#000000", "#ffffff"),
+    ("history_line", "#88ff88", None),
+    ("log_line", "#ffff88", None),
+    ("command_border", "#8888ff", None),
+    ("command_prompt", "#ffffff", None),
+    ("normal", "#ffffff", None),
+    ("hotkey", "#ffff00", None),
+    ("border_sel", "#ffff00", None),
+)
 
 
 class HexiRulesGUI:
@@ -32,19 +68,36 @@ class HexiRulesGUI:
         self.selection = SelectionState(mode="top")
         self.root.bind("<Escape>", self._on_escape)
         self.root.bind("<Control-q>", self._on_ctrl_q)
-        for key, frame_id in [
-            ("w", "worlds"),
-            ("r", "rules"),
-            ("h", "history"),
-            ("l", "logs"),
-        ]:
-            self._bind_frame_key(key, frame_id)
         self.root.focus_set()
 
         self.hex_items: Dict[Tuple[int, int], int] = {}
         self.canvas: tk.Canvas | None = None
         self.canvas_center = (0, 0)
         self.controller = WorldService()
+        # Last rendered ASCII layout, reused while nothing it shows has changed
+        self._ascii_cache_key: Any = None
+        # Layouts render on a worker; only the newest request (by seq) is shown
+        self._ascii_pool = ThreadPoolExecutor(max_workers=1)
+        self._ascii_seq = 0
+        self._ascii_pending_key: Any = None
+        # Finished renders as (seq, key, future); the worker only puts here and
+        # the Tk thread drains it, so Tk is never called off the main thread
+        self._ascii_done: "queue.Queue[Tuple[int, Any, Future]]" = queue.Queue()
+        self._ascii_polling = False
+        self._ascii_cache_lines: Sequence[str] = ()
+        # Steps run on their own worker against a private copy of the world
+        # (_sim_world, only touched by that worker) so long rule sets never
+        # block Tk and Tk never sees a half-applied generation. The result is
+        # swapped into the live world on the Tk thread; requests made while a
+        # step runs are counted and run one after another. One poll chain
+        # (_step_polling) collects them.
+        self._sim_pool = ThreadPoolExecutor(max_workers=1)
+        self._sim_world: Optional[World] = None
+        self._step_future: Optional[Future] = None
+        self._step_version = 0
+        self._steps_queued = 0
+        self._step_polling = False
+        self._ascii_cache_tags: Sequence[Sequence[Tuple[int, int, str]]] = ()
 
         # ASCII panel
         ASCII_PANEL_HEIGHT = 51  # Number of lines in the ASCII panel
@@ -52,43 +105,34 @@ class HexiRulesGUI:
 
         self.ascii_frame = ttk.Frame(self.root)
         self.ascii_frame.pack(side=tk.LEFT, fill=tk.Y, padx=8, pady=8)
-        self.ascii_text = tk.Text(
+        # Monospace grid of text items: one row per layout line plus the prompt
+        self._ascii_font = ("Courier", 10)
+        font = tkfont.Font(root=self.root, family="Courier", size=10)
+        self._char_w = font.measure("0")
+        self._char_h = font.metrics("linespace")
+        rows = ASCII_PANEL_HEIGHT + 1
+        self.ascii_canvas = tk.Canvas(
             self.ascii_frame,
-            width=81,
-            height=ASCII_PANEL_HEIGHT,
-            wrap="none",
-            font=("Courier", 10),
-            padx=2,
-            pady=2,
+            width=81 * self._char_w + 4,
+            height=rows * self._char_h + 4,
+            bg=ASCII_BG,
+            highlightthickness=0,
             bd=0,
         )
-        self.ascii_text.config(bg="#3d033d", fg="#ffffff", insertbackground="#ffffff")
-        self.ascii_text.pack(side=tk.TOP)
-        self.ascii_text.bind("<MouseWheel>", lambda e: "break")
-        self.ascii_text.bind("<Button-4>", lambda e: "break")
-        self.ascii_text.bind("<Button-5>", lambda e: "break")
+        self.ascii_canvas.pack(side=tk.TOP)
+        # Per row: text and tag-range hash last drawn, the canvas items drawing
+        # it and its colour spans as [start, end, fg, text item id or None]
+        self._row_text: List[Optional[str]] = [None] * rows
+        self._row_tags_hash: List[int] = [0] * rows
+        self._span_ids: List[List[int]] = [[] for _ in range(rows)]
+        self._row_spans: List[List[List[Any]]] = [[] for _ in range(rows)]
+        # A Canvas has no default wheel scrolling, so no wheel events are bound
 
         # Command input will be captured in ASCII-only mode (no Tk Entry)
         self.command_buffer = ""
         # Bind global keys to feed command buffer when ascii panel focused
         self.root.bind("<Key>", self._on_key)
 
-        # Tags for ascii renderer
-        self.ascii_text.tag_config("border", foreground="#cccccc")
-        self.ascii_text.tag_config("title", foreground="#ffffff")
-        self.ascii_text.tag_config("status", foreground="#d0d0d0")
-        self.ascii_text.tag_config("section_header", foreground="#a0a0ff")
-        self.ascii_text.tag_config(
-            "selected_item", background="#ffffff", foreground="#000000"
-        )
-        self.ascii_text.tag_config("history_line", foreground="#88ff88")
-        self.ascii_text.tag_config("log_line", foreground="#ffff88")
-        self.ascii_text.tag_config("command_border", foreground="#8888ff")
-        self.ascii_text.tag_config("command_prompt", foreground="#ffffff")
-        self.ascii_text.tag_config("normal", foreground="#ffffff")
-        self.ascii_text.tag_config("hotkey", foreground="#ffff00")
-        self.ascii_text.tag_config("border_sel", foreground="#ffff00")
-
         # Right: hex canvas
         self.right_frame = tk.Frame(self.root, bg="#3d033d")
         self.right_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -104,45 +148,85 @@ class HexiRulesGUI:
         self.hex_canvas_helper.canvas.pack(
             in_=self.right_frame, anchor="center", expand=True
         )
+        self._build_cell_items()
 
         self.selected_cell = (0, 0)
+        # Latest pointer position; motion events only record it
+        self._last_motion_xy: Optional[Tuple[int, int]] = None
+        self._motion_pending = False
+        # What needs redrawing at the next idle flush (see _mark_dirty)
+        self._grid_dirty = False
+        self._ascii_dirty = False
+        self._flush_pending = False
+        # Canvas cells inside the current world's radius (see _valid_cells_for)
+        self._valid_radius: Optional[int] = None
+        self._valid_cells: FrozenSet[Tuple[int, int]] = frozenset()
         self.hex_canvas_helper.canvas.bind("<Button-1>", self._on_canvas_click)
         self.hex_canvas_helper.canvas.bind("<Motion>", self._on_canvas_motion)
 
         self.update_display()
         self.update_ascii_panel()
 
-    def _on_key(self, event) -> None:
+    def _on_key(self, event) -> Any:
+        frame_id = FRAME_KEYS.get(event.keysym.lower())
+        if frame_id is not None:
+            self._select_frame(frame_id)
+            return "break"
         # simple handling: Enter submits, Escape clears buffer, BackSpace deletes
         if event.keysym == "Return":
             cmd = self.command_buffer.strip()
             self.command_buffer = ""
             if cmd:
                 self.execute_command(cmd)
-                self.update_display()
-            self.update_ascii_panel()
+            self._mark_dirty(grid=bool(cmd))
             return
         if event.keysym == "Escape":
             self.command_buffer = ""
-            self.update_ascii_panel()
+            self._mark_dirty()
             return
         if event.keysym == "BackSpace":
             self.command_buffer = self.command_buffer[:-1]
-            self.update_ascii_panel()
+            self._mark_dirty()
             return
         # Only accept printable characters
         if len(event.char) == 1 and event.char.isprintable():
             self.command_buffer += event.char
+            self._mark_dirty()
+
+    def _mark_dirty(self, grid: bool = False, ascii: bool = True) -> None:
+        """Schedule one idle redraw of the canvas and/or the ASCII panel.
+
+        Bursts of events between idle points collapse into a single flush
+        that only redraws what some event marked dirty.
+        """
+        self._grid_dirty = self._grid_dirty or grid
+        self._ascii_dirty = self._ascii_dirty or ascii
+        if not self._flush_pending:
+            self._flush_pending = True
+            self.root.after_idle(self._flush_dirty)
+
+    def _flush_dirty(self) -> None:
+        self._flush_pending = False
+        grid, ascii_panel = self._grid_dirty, self._ascii_dirty
+        self._grid_dirty = self._ascii_dirty = False
+        if grid:
+            self.update_display()
+        if ascii_panel:
             self.update_ascii_panel()
 
     def execute_command(self, command: str) -> None:
         cmd = command.strip().lower()
         if not cmd:
             return
+        self._ascii_cache_key = None
+        self._ascii_pending_key = None
         world = self._get_current_world()
         if cmd in ("s", "step"):
             self.step()
-        elif cmd in ("c", "clear"):
+            return
+        # Other commands touch the world, so let an in-flight step land first
+        self._wait_for_step()
+        if cmd in ("c", "clear"):
             self.clear()
         elif cmd in ("r", "randomize"):
             self.randomize()
@@ -153,69 +237,189 @@ class HexiRulesGUI:
             world.rules_text = rule_text
 
     def run(self) -> None:
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self._ascii_pool.shutdown(wait=False)
+            self._sim_pool.shutdown(wait=False)
 
     def update_ascii_panel(self) -> None:
+        key = (self.controller.version(), self.selection, self.selected_cell)
+        if key != self._ascii_cache_key and key != self._ascii_pending_key:
+            self._submit_ascii_render(key)
+        # Show the last layout now (the prompt row is always current); the
+        # fresh one replaces it when the worker finishes
+        self._draw_ascii_rows(self._ascii_cache_lines, self._ascii_cache_tags)
+
+    def _submit_ascii_render(self, key: Any) -> None:
+        self._ascii_seq += 1
+        seq = self._ascii_seq
+        self._ascii_pending_key = key
+        # The view model is a snapshot of worlds, history, cells and rules
+        # taken here on the Tk thread; the worker only lays it out
+        layout = AsciiUILayout(
+            self.controller,
+            selection=self.selection,
+            selected_info=self._selected_info(),
+        )
+        future = self._ascii_pool.submit(
+            self._render_ascii_layout, layout, layout.view_model()
+        )
+        future.add_done_callback(lambda done: self._ascii_done.put((seq, key, done)))
+        if not self._ascii_polling:
+            self._ascii_polling = True
+            self.root.after(ASCII_POLL_MS, self._drain_ascii_done)
+
+    def _drain_ascii_done(self) -> None:
+        while True:
+            try:
+                seq, key, future = self._ascii_done.get_nowait()
+            except queue.Empty:
+                break
+            self._apply_ascii_layout(seq, key, future)
+        if self._ascii_pending_key is None:
+            self._ascii_polling = False
+        else:
+            self.root.after(ASCII_POLL_MS, self._drain_ascii_done)
+
+    def _apply_ascii_layout(self, seq: int, key: Any, future: Future) -> None:
+        if seq != self._ascii_seq:
+            return  # superseded by a newer request
+        self._ascii_pending_key = None
         try:
-            selected_info = None
-            if self.selected_cell:
-                q, r = self.selected_cell
-                try:
-                    world = self._get_current_world()
-                    cell = world.hex.get_cell(q, r)
-                    dir_text = (
-                        str(cell.direction) if cell.direction is not None else "-"
-                    )
-                    selected_info = (
-                        f"Selected: ({q},{r}) state={cell.state} dir={dir_text}"
-                    )
-                except Exception:
-                    selected_info = f"Selected: ({q},{r})"
-            layout = AsciiUILayout(
-                self.controller, selection=self.selection, selected_info=selected_info
-            )
-            lines, tags = layout.render()
+            lines, tags = future.result()
         except Exception:
-            lines = [" " * 81 for _ in range(51)]
-            tags = [[] for _ in range(51)]
-
-        self.ascii_text.config(state=tk.NORMAL)
-        self.ascii_text.delete("1.0", tk.END)
-        for line in lines:
-            self.ascii_text.insert(tk.END, line + "\n")
-        for i, line_tags in enumerate(tags):
-            line_no = i + 1
-            width = len(lines[i]) if i < len(lines) else 81
-            for start, end, tag in line_tags:
+            key = None
+            lines, tags = BLANK_ASCII_LINES, BLANK_ASCII_TAGS
+        self._ascii_cache_key = key
+        self._ascii_cache_lines, self._ascii_cache_tags = lines, tags
+        self._draw_ascii_rows(lines, tags)
+
+    def _draw_ascii_rows(
+        self, lines: Sequence[str], tags: Sequence[Sequence[Tuple[int, int, str]]]
+    ) -> None:
+        height = self.ASCII_PANEL_HEIGHT
+        prompt = "> " + (self.command_buffer or "")
+        rows: List[Tuple[str, Sequence[Tuple[int, int, str]]]]
+        rows = list(zip(lines, tags))[:height]
+        rows += [("", ())] * (height - len(rows))
+        rows.append((prompt, [(0, len(prompt), "command_prompt")]))
+        for i, (line, line_tags) in enumerate(rows):
+            tags_hash = hash(tuple(line_tags))
+            old_line = self._row_text[i]
+            if tags_hash == self._row_tags_hash[i] and old_line is not None:
+                if line == old_line:
+                    continue
+                if len(line) == len(old_line):
+                    # Same colour runs: only swap the text of existing items
+                    self._retext_ascii_row(i, line)
+                    self._row_text[i] = line
+                    continue
+            self._draw_ascii_row(i, line, line_tags)
+            self._row_text[i] = line
+            self._row_tags_hash[i] = tags_hash
+
+    def _draw_ascii_row(
+        self, row: int, line: str, line_tags: Sequence[Tuple[int, int, str]]
+    ) -> None:
+        """Replace the canvas items of one panel row with fresh colour spans."""
+        canvas = self.ascii_canvas
+        if self._span_ids[row]:
+            canvas.delete(*self._span_ids[row])
+        ids: List[int] = []
+        spans: List[List[Any]] = []
+        y = 2 + row * self._char_h
+        for start, end, fg, bg in self._ascii_spans(line, line_tags):
+            if bg is None and not line[start:end].strip():
+                spans.append([start, end, fg, None])
+                continue
+            x = 2 + start * self._char_w
+            if bg is not None:
+                ids.append(
+                    canvas.create_rectangle(
+                        x,
+                        y,
+                        2 + end * self._char_w,
+                        y + self._char_h,
+                        fill=bg,
+                        outline="",
+                    )
+                )
+            text_id = self._create_ascii_text(row, start, line[start:end], fg)
+            ids.append(text_id)
+            spans.append([start, end, fg, text_id])
+        self._span_ids[row] = ids
+        self._row_spans[row] = spans
+
+    def _retext_ascii_row(self, row: int, line: str) -> None:
+        """Update the text of a row whose colour spans are unchanged."""
+        canvas = self.ascii_canvas
+        for span in self._row_spans[row]:
+            start, end, fg, text_id = span
+            text = line[start:end]
+            if text_id is not None:
+                canvas.itemconfigure(text_id, text=text)
+            elif text.strip():
+                span[3] = self._create_ascii_text(row, start, text, fg)
+                self._span_ids[row].append(span[3])
+
+    def _create_ascii_text(self, row: int, col: int, text: str, fg: str) -> int:
+        return self.ascii_canvas.create_text(
+            2 + col * self._char_w,
+            2 + row * self._char_h,
+            anchor="nw",
+            text=text,
+            fill=fg,
+            font=self._ascii_font,
+        )
+
+    @staticmethod
+    def _ascii_spans(
+        line: str, line_tags: Sequence[Tuple[int, int, str]]
+    ) -> List[Tuple[int, int, str, Optional[str]]]:
+        """Split a line into runs of equal (foreground, background) colours."""
+        width = len(line)
+        if not width:
+            return []
+        fgs: List[str] = [ASCII_FG] * width
+        bgs: List[Optional[str]] = [None] * width
+        for tag, fg, bg in ASCII_TAG_STYLES:
+            for start, end, name in line_tags:
+                if name != tag:
+                    continue
                 s = max(0, min(width - 1, start))
                 e = max(0, min(width, end))
-                try:
-                    self.ascii_text.tag_add(tag, f"{line_no}.{s}", f"{line_no}.{e}")
-                except Exception:
-                    pass
-        self.ascii_text.config(state=tk.DISABLED)
-        # Render command prompt overlay at the bottom (above footer)
+                if fg is not None:
+                    fgs[s:e] = [fg] * (e - s)
+                if bg is not None:
+                    bgs[s:e] = [bg] * (e - s)
+        spans: List[Tuple[int, int, str, Optional[str]]] = []
+        start = 0
+        for i in range(1, width + 1):
+            if i == width or fgs[i] != fgs[start] or bgs[i] != bgs[start]:
+                spans.append((start, i, fgs[start], bgs[start]))
+                start = i
+        return spans
+
+    def _selected_info(self) -> Optional[str]:
+        if not self.selected_cell:
+            return None
+        q, r = self.selected_cell
         try:
-            prompt_line = self.ascii_text.index(f"{51}.0")
-        except Exception:
-            prompt_line = None
-        # Put command buffer in the selected line (selected frame is at y=33; prompt at 50)
-        # We'll just insert the buffer onto the last visible line manually
-        self.ascii_text.config(state=tk.NORMAL)
-        try:
-            # remove last line then re-insert with prompt
-            prompt_line_num = self.ASCII_PANEL_HEIGHT + 1
-            self.ascii_text.delete(f"{prompt_line_num}.0", tk.END)
-        except Exception:
-            pass
-        try:
-            self.ascii_text.insert(tk.END, "\n")
-            prompt = "> " + (self.command_buffer or "")
-            self.ascii_text.insert(tk.END, prompt)
-            self.ascii_text.tag_add("command_prompt", f"end-1c linestart", f"end-1c")
+            world = self._get_current_world()
+            cell = world.hex.get_cell(q, r)
+            dir_text = str(cell.direction) if cell.direction is not None else "-"
+            return f"Selected: ({q},{r}) state={cell.state} dir={dir_text}"
         except Exception:
-            pass
-        self.ascii_text.config(state=tk.DISABLED)
+            return f"Selected: ({q},{r})"
+
+    @staticmethod
+    def _render_ascii_layout(
+        layout: AsciiUILayout, vm: AsciiViewModel
+    ) -> Tuple[List[str], List[List[Tuple[int, int, str]]]]:
+        """Lay out a view model snapshot; runs on the render worker thread."""
+        lines_tags = layout.render_view_model(vm)
+        return cast(Tuple[List[str], List[List[Tuple[int, int, str]]]], lines_tags)
 
     def _get_current_world(self):
         return self.controller.get_current_world()
@@ -223,12 +427,34 @@ class HexiRulesGUI:
     def _on_ctrl_q(self, _event: tk.Event) -> None:
         self.root.quit()
 
-    def _bind_frame_key(self, key: str, frame_id: str) -> None:
-        def handler(_event: tk.Event) -> None:
-            self._select_frame(frame_id)
-
-        self.root.bind(key, handler)
-        self.root.bind(key.upper(), handler)
+    def _build_cell_items(self) -> None:
+        """Create one persistent polygon per cell; redraws only recolour them."""
+        canvas = self.hex_canvas_helper.canvas
+        self._draw_list: List[Tuple[int, int, int, int, int]] = []
+        # Corner lists per cell, precomputed by HexCanvas; also used to move
+        # the selection outline
+        self._sel_poly_cache: Dict[Tuple[int, int], List[int]] = (
+            self.hex_canvas_helper.cell_polygons
+        )
+        # Build loop state bound to locals once
+        polygons = self._sel_poly_cache
+        items = self.hex_items
+        draw_list = self._draw_list
+        create_polygon = canvas.create_polygon
+        for (q, r), (cx, cy) in self.hex_canvas_helper.cells.items():
+            poly_id = items[(q, r)] = create_polygon(
+                polygons[(q, r)], fill=EMPTY_CELL_COLOR, outline="#333333"
+            )
+            draw_list.append((q, r, cx, cy, poly_id))
+        # Per draw-list index: (state, direction) on screen and direction dot id
+        self._last_cells: List[Any] = [("_", None)] * len(self._draw_list)
+        self._dot_ids: List[Optional[int]] = [None] * len(self._draw_list)
+        # Parallel lists for nearest-centre hit testing
+        self._hit_cells = [(q, r) for q, r, _, _, _ in self._draw_list]
+        self._hit_centers = [(cx, cy) for _, _, cx, cy, _ in self._draw_list]
+        self._sel_id = canvas.create_polygon(
+            [0] * 12, fill="", outline="#ffffff", width=2, state="hidden"
+        )
 
     def update_display(self) -> None:
         try:
@@ -236,27 +462,42 @@ class HexiRulesGUI:
         except Exception:
             return
         canvas = self.hex_canvas_helper.canvas
-        canvas.delete("all")
-        for (q, r), (cx, cy) in self.hex_canvas_helper.cells.items():
-            cell = world.hex.get_cell(q, r)
-            color = (
-                "#111111"
-                if cell.state == "_"
-                else STATE_COLORS.get(cell.state, "#ffffff")
-            )
-            pts = self.hex_canvas_helper.polygon_corners(cx, cy)
-            tag = f"cell_{q}_{r}"
-            canvas.create_polygon(pts, fill=color, outline="#333333", tags=(tag,))
-            if getattr(cell, "direction", None):
-                canvas.create_oval(
+        # One bulk read per frame instead of a get_cell call per cell
+        _, states, directions = world.hex.snapshot(self.hex_canvas_helper.cells)
+        fill_for = CELL_FILLS.get
+        itemconfigure = canvas.itemconfigure
+        # Fill updates go straight to Tcl, skipping itemconfigure's option
+        # formatting: "<canvas path> itemconfigure <id> -fill <colour>"
+        tk_call = canvas.tk.call
+        canvas_path = canvas._w
+        # Hot-loop state bound to locals once per frame
+        last = self._last_cells
+        dots = self._dot_ids
+        draw_list = self._draw_list
+        create_oval = canvas.create_oval
+        # Only cells whose (state, direction) changed since last frame touch Tk
+        for i, cell in enumerate(zip(states, directions)):
+            if cell == last[i]:
+                continue
+            last[i] = cell
+            state, direction = cell
+            _, _, cx, cy, poly_id = draw_list[i]
+            fill = fill_for(state, UNKNOWN_CELL_COLOR)
+            tk_call(canvas_path, "itemconfigure", poly_id, "-fill", fill)
+            if direction and dots[i] is None:
+                dots[i] = create_oval(
                     cx - 3, cy - 3, cx + 3, cy + 3, fill="#ffff00", outline=""
                 )
-        if self.selected_cell:
-            q, r = self.selected_cell
-            if (q, r) in self.hex_canvas_helper.cells:
-                cx, cy = self.hex_canvas_helper.cells[(q, r)]
-                pts = self.hex_canvas_helper.polygon_corners(cx, cy)
-                canvas.create_polygon(pts, fill="", outline="#ffffff", width=2)
+            elif not direction and dots[i] is not None:
+                canvas.delete(dots[i])
+                dots[i] = None
+        pts = self._sel_poly_cache.get(self.selected_cell)
+        if pts:
+            canvas.coords(self._sel_id, *pts)
+            itemconfigure(self._sel_id, state="normal")
+            canvas.tag_raise(self._sel_id)
+        else:
+            itemconfigure(self._sel_id, state="hidden")
 
     def _on_canvas_click(self, event: Any) -> None:
         q, r = self.get_hex_coordinates(event.x, event.y)
@@ -264,55 +505,149 @@ class HexiRulesGUI:
             world = self._get_current_world()
         except Exception:
             return
-        R = int(getattr(world, "radius", DEFAULT_RADIUS))
-        if abs(q) <= R and abs(r) <= R and abs(q + r) <= R:
+        if (q, r) in self._valid_cells_for(world):
             self.selected_cell = (q, r)
 
+    def _valid_cells_for(self, world: Any) -> FrozenSet[Tuple[int, int]]:
+        """Return the in-bounds cells of ``world``, cached per radius."""
+        radius = int(getattr(world, "radius", DEFAULT_RADIUS))
+        if radius != self._valid_radius:
+            self._valid_cells = frozenset(
+                cell
+                for cell in self.hex_canvas_helper.cells
+                if max(abs(cell[0]), abs(cell[1]), abs(cell[0] + cell[1])) <= radius
+            )
+            self._valid_radius = radius
+        return self._valid_cells
+
     def step(self) -> None:
+        """Step the world on the simulation worker, after any running step."""
+        if not self._get_current_world().rules_text:
+            return  # nothing to apply, as WorldService.step
+        if self._step_future is not None:
+            self._steps_queued += 1
+            return
+        self._submit_step()
+
+    def _submit_step(self) -> None:
         world = self._get_current_world()
-        self.controller.step(world.rules_text or "")
+        self._step_version = self.controller.version()
+        self._step_future = self._sim_pool.submit(
+            self._step_detached,
+            world.name,
+            world.radius,
+            world.rules_text or "",
+            list(world.hex.iter_active()),
+        )
+        if not self._step_polling:
+            self._step_polling = True
+            self.root.after(STEP_POLL_MS, self._poll_step)
+
+    def _step_detached(
+        self,
+        name: str,
+        radius: int,
+        rules_text: str,
+        cells: List[Tuple[int, int, str, Optional[int]]],
+    ) -> Tuple[List[Tuple[int, int, str, Optional[int]]], str, List[str]]:
+        """Step a private copy of the world; runs on the simulation worker.
+
+        The copy is reused while the world keeps its name and radius, so its
+        parsed rules and match caches survive from one step to the next.
+        """
+        sim = self._sim_world
+        if sim is None or sim.name != name or sim.radius != radius:
+            sim = self._sim_world = World(name=name, radius=radius)
+        sim.hex.load_cells(cells)
+        logs = WorldService.step_world(sim, rules_text)
+        return list(sim.hex.iter_active()), sim.rules_text, logs
+
+    def _poll_step(self) -> None:
+        future = self._step_future
+        try:
+            if future is not None and future.done():
+                self._finish_step(future)
+                if self._steps_queued:
+                    self._steps_queued -= 1
+                    self._submit_step()
+        finally:
+            # Keep polling while a step runs; otherwise let the chain end
+            if self._step_future is None:
+                self._step_polling = False
+            else:
+                self.root.after(STEP_POLL_MS, self._poll_step)
+
+    def _finish_step(self, future: Future) -> None:
+        """Install a finished step on the Tk thread."""
+        self._step_future = None
+        self._mark_dirty(grid=True)
+        try:
+            cells, rules_text, logs = future.result()
+        except Exception:
+            self._steps_queued = 0
+            raise  # step errors surface on the Tk thread as before
+        if self.controller.version() == self._step_version:
+            self.controller.apply_step(cells, rules_text, logs)
+        else:
+            # The world changed under the step: redo it from the new state
+            self._steps_queued += 1
+
+    def _wait_for_step(self) -> None:
+        """Install the running step, if any, and cancel the queued ones."""
+        if self._step_future is not None:
+            self._finish_step(self._step_future)
+        self._steps_queued = 0
 
     def clear(self) -> None:
-        world = self._get_current_world()
-        world.hex.clear()
+        self.controller.clear()
 
     def randomize(self) -> None:
         self.controller.randomize(list(STATE_COLORS.keys()))
 
     def _on_canvas_motion(self, event: Any) -> None:
-        q, r = self.get_hex_coordinates(event.x, event.y)
+        self._last_motion_xy = (event.x, event.y)
+        if not self._motion_pending:
+            self._motion_pending = True
+            self.root.after(MOTION_INTERVAL_MS, self._motion_tick)
+
+    def _motion_tick(self) -> None:
+        self._motion_pending = False
+        if self._last_motion_xy is None:
+            return
+        q, r = self.get_hex_coordinates(*self._last_motion_xy)
         try:
             world = self._get_current_world()
         except Exception:
             return
-        R = int(getattr(world, "radius", DEFAULT_RADIUS))
-        if abs(q) <= R and abs(r) <= R and abs(q + r) <= R:
+        if (q, r) in self._valid_cells_for(world):
             if self.selected_cell != (q, r):
                 self.selected_cell = (q, r)
-                self.update_display()
-                self.update_ascii_panel()
+                self._mark_dirty(grid=True)
 
     def get_hex_coordinates(self, x: int, y: int) -> Tuple[int, int]:
-        best = None
-        best_dist = float("inf")
-        for (q, r), (cx, cy) in self.hex_canvas_helper.cells.items():
-            dx = cx - x
-            dy = cy - y
-            d = dx * dx + dy * dy
-            if d < best_dist:
-                best_dist = d
-                best = (q, r)
-        if best is None:
+        q, r = self.hex_canvas_helper.pixel_to_axial(x, y)
+        if (q, r) in self.hex_canvas_helper.cells:
+            return q, r
+        # Off the grid: snap to the nearest cell centre as before
+        if not self._hit_cells:
             return (0, 0)
-        return best
+        # Distances in one comprehension; min/index run in C (first match wins)
+        dists = [(cx - x) ** 2 + (cy - y) ** 2 for cx, cy in self._hit_centers]
+        return self._hit_cells[dists.index(min(dists))]
 
     def _select_frame(self, frame_id: str) -> None:
-        self.selection = SelectionState(mode="frame", frame_id=frame_id)
-        self.update_ascii_panel()
+        selection = SelectionState(mode="frame", frame_id=frame_id)
+        if selection == self.selection:
+            return
+        self.selection = selection
+        self._mark_dirty()
 
     def _on_escape(self, event: Any) -> None:
-        self.selection = SelectionState(mode="top")
-        self.update_ascii_panel()
+        selection = SelectionState(mode="top")
+        if selection == self.selection:
+            return
+        self.selection = selection
+        self._mark_dirty()
 
 
 def create_gui() -> HexiRulesGUI:
@@ -14,16 +14,9 @@ Also exposes a minimal HexCanvas helper used by geometry-focused tests.
 
 import importlib
 import os
-import shutil
-import subprocess
 import math
 from typing import Dict, Tuple, List, Any
 
-try:
-    import tkinter as tk  # Only needed when tests instantiate the canvas
-except Exception:  # pragma: no cover - allow headless import
-    tk = None  # type: ignore[assignment]
-
 
 class HexCanvas:
     """A lightweight hex grid canvas providing geometry helpers for tests.
@@ -33,8 +26,11 @@ class HexCanvas:
     """
 
     def __init__(self, root: Any, radius: int = 3, cell_size: int = 20) -> None:
-        if tk is None:
-            raise RuntimeError("Tkinter not available")
+        # Imported here so headless modes never load Tk
+        try:
+            import tkinter as tk
+        except Exception as e:  # pragma: no cover - headless install
+            raise RuntimeError("Tkinter not available") from e
         self.root = root
         self.radius = radius
         self.cell_size = cell_size
@@ -47,30 +43,66 @@ class HexCanvas:
 
         self.canvas = tk.Canvas(root, width=grid_w, height=grid_h)
 
-        # Precompute cell centers for axial coordinates within the radius
+        # Corner offsets from a cell centre, computed once instead of per polygon
+        # (flat-top hexagon cells: start at 0 degrees and step by 60 degrees)
+        self._corner_offsets: List[Tuple[float, float]] = [
+            (
+                self.cell_size * math.cos(math.radians(60 * i)),
+                self.cell_size * math.sin(math.radians(60 * i)),
+            )
+            for i in range(6)
+        ]
+
+        # Precompute cell centers and outlines for axial coordinates within the radius
         self.cells: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        self.cell_polygons: Dict[Tuple[int, int], List[int]] = {}
+        # Same projection as axial_to_pixel; x depends only on q, so it is
+        # computed once per column
         for q in range(-radius, radius + 1):
             r_min = max(-radius, -q - radius)
             r_max = min(radius, -q + radius)
+            x = self._axial_x(q)
             for r in range(r_min, r_max + 1):
-                x, y = self.axial_to_pixel(q, r)
+                y = self._axial_y(q, r)
                 self.cells[(q, r)] = (x, y)
+                self.cell_polygons[(q, r)] = self.polygon_corners(x, y)
 
     def axial_to_pixel(self, q: int, r: int) -> Tuple[int, int]:
         """Convert axial (q, r) to pixel coordinates (pointy-top grid structure)."""
-        x = self.center_x + int(round(self.cell_size * (3 / 2) * q))
-        y = self.center_y + int(round(self.cell_size * math.sqrt(3) * (r + q / 2)))
-        return x, y
+        return self._axial_x(q), self._axial_y(q, r)
+
+    def _axial_x(self, q: int) -> int:
+        """Pixel x of every cell in column q."""
+        return self.center_x + int(round(self.cell_size * (3 / 2) * q))
+
+    def _axial_y(self, q: int, r: int) -> int:
+        """Pixel y of cell (q, r)."""
+        return self.center_y + int(round(self.cell_size * math.sqrt(3) * (r + q / 2)))
+
+    def pixel_to_axial(self, x: float, y: float) -> Tuple[int, int]:
+        """Return the axial (q, r) of the cell containing pixel (x, y).
+
+        Inverts axial_to_pixel and rounds in cube coordinates, fixing the
+        component with the largest rounding error so that q + r + s == 0.
+        """
+        px = (x - self.center_x) / self.cell_size
+        py = (y - self.center_y) / self.cell_size
+        qf = 2 / 3 * px
+        rf = -1 / 3 * px + math.sqrt(3) / 3 * py
+        sf = -qf - rf
+        q, r, s = round(qf), round(rf), round(sf)
+        dq, dr, ds = abs(q - qf), abs(r - rf), abs(s - sf)
+        if dq > dr and dq > ds:
+            q = -r - s
+        elif dr > ds:
+            r = -q - s
+        return q, r
 
     def polygon_corners(self, cx: int, cy: int) -> List[int]:
         """Return the 6-point polygon around (cx, cy) as a flat list of 12 ints."""
         pts: List[int] = []
-        # flat-top hexagon cells: start at 0 degrees and step by 60 degrees
-        for i in range(6):
-            angle_rad = math.radians(60 * i)
-            x = cx + self.cell_size * math.cos(angle_rad)
-            y = cy + self.cell_size * math.sin(angle_rad)
-            pts.extend([int(round(x)), int(round(y))])
+        for dx, dy in self._corner_offsets:
+            pts.extend([int(round(cx + dx)), int(round(cy + dy))])
         return pts
 
 
@@ -86,6 +118,8 @@ def _run_react_desktop() -> None:
     Requires server dependencies (fastapi/uvicorn) and pywebview for the desktop window.
     Falls back to opening a browser if pywebview is unavailable.
     """
+    import shutil
+    import subprocess
     import threading
     import time
     import webbrowser
@@ -204,7 +238,6 @@ def _run_pure_cli(argv: List[str] | None = None) -> None:
 def main(argv: List[str] | None = None) -> None:
     """Main entry point for HexiRules launcher."""
     import sys
-    import os
     import argparse
 
     # Add current directory to path if not already there
@@ -24,6 +24,11 @@ class TestAsciiRenderer(unittest.TestCase):
         self.assertIn((0, 7, "border_sel"), tags[0])
         self.assertIn((7, 14, "border"), tags[0])
 
+    def test_render_text_only_matches_render(self) -> None:
+        vm, layout, selection, expected = sample_text()
+        renderer = AsciiRenderer(vm, layout, selection)
+        self.assertEqual(renderer.render_text_only(), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
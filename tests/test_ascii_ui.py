@@ -3,7 +3,11 @@ import os
 import tempfile
 import unittest
 
-from infrastructure.ui.hexios.desktop.ascii.facade import AsciiControlPanel
+from infrastructure.ui.hexios.desktop.ascii.facade import (
+    AsciiControlPanel,
+    AsciiUILayout,
+)
+from infrastructure.ui.hexios.desktop.ascii.viewmodel import AsciiViewModel
 from application.world_service import WorldService
 
 
@@ -49,6 +53,30 @@ class TestAsciiUI(unittest.TestCase):
         self.assertIn("Stepped", out.getvalue())
         self.assertIn("Cleared", out.getvalue())
 
+    def test_view_model_cached_until_state_changes(self) -> None:
+        first = AsciiViewModel.from_controller(self.controller)
+        self.assertIs(AsciiViewModel.from_controller(self.controller), first)
+        self.controller.set_cell(0, 0, "a", None)
+        second = AsciiViewModel.from_controller(self.controller)
+        self.assertIsNot(second, first)
+        self.controller.get_current_world().rules_text = "a => a"
+        self.assertIsNot(AsciiViewModel.from_controller(self.controller), second)
+
+    def test_layout_renders_view_model_snapshot(self) -> None:
+        layout = AsciiUILayout(self.controller)
+        vm = layout.view_model()
+        before = layout.render()
+        self.controller.set_cell(0, 0, "a", None)
+        self.controller.create_world("other", 2, True, "")
+        self.assertEqual(layout.render_view_model(vm), before)
+        self.assertNotEqual(layout.render(), before)
+
+    def test_rules_lines_follow_rules_text(self) -> None:
+        world = self.controller.get_current_world()
+        self.assertEqual(world.rules_lines(), ("a => _",))
+        world.rules_text = " a => b \n\n b => _"
+        self.assertEqual(world.rules_lines(), ("a => b", "b => _"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -56,6 +56,13 @@ class TestHexCanvas(unittest.TestCase):
         # Should have 12 coordinates (6 points * 2 coordinates each)
         self.assertEqual(len(corners), 12)
 
+    def test_pixel_to_axial_round_trip(self):
+        canvas = HexCanvas(self.root, radius=3)
+        for (q, r), (x, y) in canvas.cells.items():
+            self.assertEqual(canvas.pixel_to_axial(x, y), (q, r))
+            # A few pixels off-centre still lands in the same cell
+            self.assertEqual(canvas.pixel_to_axial(x + 4, y - 4), (q, r))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -162,6 +162,17 @@ class TestHexRules(unittest.TestCase):
         cell = self.automaton.get_cell(0, 0)
         self.assertEqual((cell.state, cell.direction), ("b", 1))
 
+    def test_single_candidate_still_draws_from_rng(self) -> None:
+        """Every firing cell consumes one RNG draw, keeping seeded runs stable."""
+        self.automaton.set_rules(["a => b"])
+        self.automaton.set_cell(0, 0, "a")
+        with patch(
+            "domain.hexidirect.rule_engine.random.choice", side_effect=lambda s: s[0]
+        ) as choice:
+            self.automaton.step()
+        self.assertEqual(choice.call_count, 1)
+        self.assertEqual(self.automaton.get_cell(0, 0).state, "b")
+
     def test_source_direction_exact_match(self) -> None:
         """'a3 => b' applies only to cells with direction 3."""
         self.automaton.set_rules(["a3 => b"])
@@ -215,6 +226,13 @@ class TestHexRules(unittest.TestCase):
         states = {opt.state for opt in rule_or.conditions[0]}
         self.assertEqual(states, {"b", "c"})
 
+    def test_neighbor_prefilter_sets(self) -> None:
+        """Parsed rules expose the neighbour states they need or forbid."""
+        rule = HexRule("a[b][1c|x][-t][-2y] => d")
+        self.assertEqual(rule.neighbor_required, {"b"})
+        self.assertEqual(rule.neighbor_any_of, (frozenset({"c", "x"}),))
+        self.assertEqual(rule.neighbor_forbidden, {"t"})
+
     def test_multi_condition_application(self) -> None:
         """Rule requires two specific neighbors and supports OR."""
         self.automaton.clear()
@@ -244,6 +262,86 @@ class TestHexRules(unittest.TestCase):
         self.automaton.step()
         self.assertEqual(self.automaton.get_cell(0, 0).state, "d")
 
+    def test_fixed_slot_and_negated_conditions(self) -> None:
+        """[1b][-2c] needs b in slot 1 and anything but c in slot 2."""
+        self.automaton.set_rules(["a[1b][-2c] => d"])
+        self.automaton.set_cell(0, 0, "a")
+        self.automaton.set_cell(1, -1, "b")
+        self.automaton.set_cell(1, 0, "c")
+        self.automaton.step()
+        self.assertEqual(self.automaton.get_cell(0, 0).state, "a")
+        self.automaton.set_cell(1, 0, "x")
+        self.automaton.step()
+        self.assertEqual(self.automaton.get_cell(0, 0).state, "d")
+
+    def test_snapshot_parallel_lists(self) -> None:
+        """snapshot returns aligned coords/states/directions, empty off-grid."""
+        self.automaton.set_cell(0, 0, "a", 2)
+        coords, states, dirs = self.automaton.snapshot([(0, 0), (1, 0), (99, 99)])
+        self.assertEqual(coords, [(0, 0), (1, 0), (99, 99)])
+        self.assertEqual(states, ["a", "_", "_"])
+        self.assertEqual(dirs, [2, None, None])
+        coords, states, _ = self.automaton.snapshot()
+        self.assertEqual(len(coords), len(self.automaton.grid))
+        self.assertEqual(states.count("a"), 1)
+
+    def test_step_sees_cells_outside_radius(self) -> None:
+        """Cells set beyond the radius still count as neighbours and step."""
+        self.automaton.set_rules(["_[a] => b", "a => _"])
+        self.automaton.set_cell(6, 0, "a")
+        self.automaton.step()
+        self.assertEqual(self.automaton.get_cell(5, 0).state, "b")
+        self.assertEqual(self.automaton.get_cell(6, 0).state, "_")
+
+    def test_empty_source_rules_reach_quiet_cells(self) -> None:
+        """Rules that fire on isolated empty cells still visit every cell."""
+        self.automaton.set_rules(["_[-a] => b"])
+        self.automaton.set_cell(0, 0, "a")
+        self.automaton.step()
+        self.assertEqual(self.automaton.get_cell(1, 0).state, "_")
+        self.assertEqual(self.automaton.get_cell(3, -3).state, "b")
+
+    def test_count_condition_matches(self) -> None:
+        """Counts agree with matches_condition over every cell and rule."""
+        self.automaton.set_rules(["a[b] => c", "b => _"])
+        self.automaton.set_cell(0, 0, "a")
+        self.automaton.set_cell(1, 0, "b")
+        self.automaton.set_cell(3, 0, "a")
+        checked, matched = self.automaton.count_condition_matches()
+        self.assertEqual(checked, 2 * len(self.automaton.grid))
+        self.assertEqual(matched, 2)
+
+    def test_memoised_candidates_are_not_shared_with_callers(self) -> None:
+        """Editing returned selections does not leak into later steps."""
+        self.automaton.set_rules(["a[_] => b"])
+        self.automaton.set_cell(0, 0, "a")
+        self.automaton.set_cell(4, -4, "a")
+        selections = self.automaton.select_applicable_rules()
+        selections[(0, 0)].clear()
+        self.automaton.step()
+        self.assertEqual(self.automaton.get_cell(0, 0).state, "b")
+        self.assertEqual(self.automaton.get_cell(4, -4).state, "b")
+
+    def test_set_rules_reuses_unchanged_rules(self) -> None:
+        """Re-setting identical rule text keeps the parsed rules."""
+        self.automaton.set_rules(["a => b%", "b[a] => c"])
+        rules = self.automaton.rules
+        self.automaton.set_rules(["a => b%", "b[a] => c"])
+        self.assertIs(self.automaton.rules, rules)
+        self.automaton.set_rules(["a => b"])
+        self.assertEqual([r.rule_str for r in self.automaton.rules], ["a => b"])
+
+    def test_rules_edited_in_place_take_effect(self) -> None:
+        """Replacing an entry of the public rules list is seen by step and set_rules."""
+        self.automaton.set_rules(["a => b"])
+        self.automaton.set_cell(0, 0, "a")
+        self.automaton.step()
+        self.automaton.rules[0] = HexRule("b => c")
+        self.automaton.step()
+        self.assertEqual(self.automaton.get_cell(0, 0).state, "c")
+        self.automaton.set_rules(["a => b"])
+        self.assertEqual([r.rule_str for r in self.automaton.rules], ["a => b"])
+
     def test_repetition_syntax(self) -> None:
         """[state]N repeats the condition block N times."""
         rules = self.automaton._expand_macros("_[a]3[_]3 => a")
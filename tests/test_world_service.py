@@ -0,0 +1,85 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from application.world_service import WorldService
+from domain.worlds.world import World
+
+
+class TestWorldService(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        os.environ["HEXI_DATA_DIR"] = self.tmp.name
+        self.controller = WorldService()
+        self.controller.create_world("w", 3, True, "a => _")
+        self.controller.select_world("w")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_version_bumps_on_mutation(self) -> None:
+        v0 = self.controller.version()
+        self.controller.set_cell(0, 0, "a", None)
+        v1 = self.controller.version()
+        self.assertGreater(v1, v0)
+        self.controller.step("a => _")
+        v2 = self.controller.version()
+        self.assertGreater(v2, v1)
+        self.controller.clear()
+        self.assertGreater(self.controller.version(), v2)
+
+    def test_version_stable_on_reads(self) -> None:
+        v0 = self.controller.version()
+        self.controller.history_list()
+        self.controller.active_count()
+        self.controller.get_current_world()
+        self.assertEqual(self.controller.version(), v0)
+
+    def test_history_list_limit(self) -> None:
+        for _ in range(3):
+            self.controller.step("a => _")
+        full = self.controller.history_list()
+        self.assertEqual(self.controller.history_list(limit=2), full[:2])
+
+    def test_step_on_detached_copy_then_apply(self) -> None:
+        live = self.controller.get_current_world()
+        self.controller.set_cell(0, 0, "a", None)
+        copy = World(name=live.name, radius=live.radius)
+        copy.hex.load_cells(live.hex.iter_active())
+        v0 = self.controller.version()
+        logs = WorldService.step_world(copy, "a => b")
+        self.assertEqual(live.hex.get_cell(0, 0).state, "a")
+        self.assertEqual(self.controller.version(), v0)
+        steps = len(live.history)
+        self.controller.apply_step(list(copy.hex.iter_active()), copy.rules_text, logs)
+        self.assertEqual(live.hex.get_cell(0, 0).state, "b")
+        self.assertEqual(live.rules_text, "a => b")
+        self.assertEqual(live.hex.rules, copy.hex.rules)
+        self.assertEqual(len(live.history), steps + 1)
+        self.assertEqual(live.history[-1].logs, logs)
+        self.assertGreater(self.controller.version(), v0)
+
+    def test_save_load_round_trip(self) -> None:
+        self.controller.set_cell(1, -1, "a", 3)
+        self.controller.step("a => _")
+        path = os.path.join(self.tmp.name, "saved.json")
+        self.controller.save_world_to_file(path, True, "a => _")
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.assertEqual(
+            sorted(data),
+            ["hex_cells", "history", "history_index", "name", "radius", "rules_text"],
+        )
+        saved = self.controller.get_current_world()
+        loaded = self.controller.repository.load(Path(path))
+        self.assertEqual(loaded.rules_text, "a => _")
+        self.assertEqual(loaded.history_index, saved.history_index)
+        self.assertEqual(
+            [s.cells for s in loaded.history], [s.cells for s in saved.history]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()